@@ -0,0 +1,44 @@
+"""Add indexes for notification lookups
+
+Revision ID: dc35e8b82135
+Revises: 35e1302e1944
+Create Date: 2026-10-16 10:12:41.503217
+
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "dc35e8b82135"
+down_revision: Union[str, None] = "35e1302e1944"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Index for the upcoming/due deadline range scans
+    op.create_index(
+        "ix_deadlines_deadline_at", "deadlines", ["deadline_at"], unique=False
+    )
+
+    # Drop duplicate sent notifications before enforcing uniqueness
+    op.execute(
+        "DELETE FROM sent_notifications WHERE id NOT IN "
+        "(SELECT MIN(id) FROM sent_notifications "
+        "GROUP BY deadline_id, notification_type)"
+    )
+    op.create_index(
+        "ix_sent_notifications_deadline_type",
+        "sent_notifications",
+        ["deadline_id", "notification_type"],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_sent_notifications_deadline_type", "sent_notifications")
+    op.drop_index("ix_deadlines_deadline_at", "deadlines")
@@ -20,6 +20,8 @@ def run_tests():
         "pytest",
         "--verbose",
         "--tb=short",
+        "-n",
+        "auto",
         "--cov=services",
         "--cov=utils",
         "--cov=db",
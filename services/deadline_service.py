@@ -1,9 +1,11 @@
 import logging
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Optional
 from zoneinfo import ZoneInfo
 
-from sqlalchemy import select
+from sqlalchemy import lambda_stmt, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import async_sessionmaker
 
 from db.models import Deadline, SentNotification, User
@@ -148,17 +150,42 @@ class DeadlineService:
                 logger.info(f"Marked deadline {deadline_id} as overdue notified")
 
         except Exception as e:
+            # Only a clash on the unique (deadline_id, notification_type) index
+            # means it was already marked; other constraint failures are errors
+            if isinstance(e, IntegrityError) and await self._is_overdue_marked(
+                deadline_id
+            ):
+                logger.debug(
+                    f"Deadline {deadline_id} already marked as overdue notified"
+                )
+                return
             logger.error(
                 f"Failed to mark deadline {deadline_id} as overdue notified: {e}"
             )
             raise DatabaseError(f"Failed to mark overdue notification: {e}") from e
 
+    async def _is_overdue_marked(self, deadline_id: int) -> bool:
+        """Check if an overdue notification is already recorded for deadline"""
+        try:
+            async with self.session_factory() as session:
+                q = select(SentNotification.id).where(
+                    SentNotification.deadline_id == deadline_id,
+                    SentNotification.notification_type == "overdue",
+                )
+                res = await session.execute(q)
+                return res.scalar_one_or_none() is not None
+        except Exception as e:
+            logger.error(
+                f"Failed to check overdue notification for deadline {deadline_id}: {e}"
+            )
+            return False
+
     async def list_for_user(self, user_id: int) -> list[Deadline]:
         """Get all deadlines for a specific user"""
         try:
             async with self.session_factory() as session:
-                q = (
-                    select(Deadline)
+                q = lambda_stmt(
+                    lambda: select(Deadline)
                     .where(Deadline.user_id == user_id)
                     .order_by(Deadline.deadline_at)
                 )
@@ -235,7 +262,9 @@ class DeadlineService:
                 raise ValidationError(f"Invalid user ID: {e}")
 
             async with self.session_factory() as session:
-                q = select(Deadline).where(Deadline.id == deadline_id)
+                q = lambda_stmt(
+                    lambda: select(Deadline).where(Deadline.id == deadline_id)
+                )
                 res = await session.execute(q)
                 deadline = res.scalar_one_or_none()
 
@@ -323,7 +352,9 @@ class DeadlineService:
         """Get user's timezone, return UTC as default"""
         try:
             async with self.session_factory() as session:
-                q = select(User).where(User.telegram_id == telegram_id)
+                q = lambda_stmt(
+                    lambda: select(User).where(User.telegram_id == telegram_id)
+                )
                 res = await session.execute(q)
                 user = res.scalar_one_or_none()
 
@@ -385,6 +416,7 @@ class DeadlineService:
             raise DeadlineUpdateError(f"Failed to update deadline: {e}") from e
 
 
+@lru_cache(maxsize=1024)
 def is_valid_timezone(timezone: str) -> bool:
     """Check if timezone is valid"""
     try:
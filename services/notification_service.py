@@ -1,7 +1,9 @@
 import logging
-from datetime import datetime, timedelta, timezone
+from bisect import bisect_right
+from datetime import datetime, timezone
 
-from sqlalchemy import select
+from sqlalchemy import select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import async_sessionmaker
 
 from db.models import Deadline, NotificationSettings, SentNotification
@@ -14,6 +16,21 @@ from exceptions import (
 
 logger = logging.getLogger(__name__)
 
+# Notification timeframes sorted by lead time in seconds:
+# (lead time, settings attribute, notification type, text)
+_NOTIFICATION_TIMEFRAMES = (
+    (3600, "notify_1_hour", "1_hour", "За час"),
+    (3 * 3600, "notify_3_hours", "3_hours", "За 3 часа"),
+    (86400, "notify_1_day", "1_day", "За день"),
+    (3 * 86400, "notify_3_days", "3_days", "За 3 дня"),
+    (7 * 86400, "notify_1_week", "1_week", "За неделю"),
+)
+# Each notification is sent within a 2 minute window after its lead time
+_NOTIFICATION_WINDOW = 120
+
+_TIMEFRAME_STARTS = [t[0] for t in _NOTIFICATION_TIMEFRAMES]
+_TIMEFRAME_ENDS = [t[0] + _NOTIFICATION_WINDOW for t in _NOTIFICATION_TIMEFRAMES]
+
 
 class NotificationService:
     def __init__(self, session_factory: async_sessionmaker):
@@ -34,13 +51,15 @@ class NotificationService:
                     session.add(settings)
                     await session.commit()
                     await session.refresh(settings)
-                    logger.info(f"Created notification settings for user {user_id}")
+                    logger.info("Created notification settings for user %s", user_id)
 
                 return settings
 
         except Exception as e:
             logger.error(
-                f"Failed to get/create notification settings for user {user_id}: {e}"
+                "Failed to get/create notification settings for user %s: %s",
+                user_id,
+                e,
             )
             raise DatabaseError(f"Failed to get notification settings: {e}") from e
 
@@ -61,31 +80,41 @@ class NotificationService:
                 raise ValidationError(f"Invalid fields: {invalid_fields}")
 
             async with self.session_factory() as session:
-                q = select(NotificationSettings).where(
-                    NotificationSettings.user_id == user_id
-                )
-                res = await session.execute(q)
+                if kwargs:
+                    # Update in place and get the row back in one round-trip
+                    update_q = (
+                        update(NotificationSettings)
+                        .where(NotificationSettings.user_id == user_id)
+                        .values(**kwargs)
+                        .returning(NotificationSettings)
+                    )
+                    res = await session.execute(update_q)
+                else:
+                    select_q = select(NotificationSettings).where(
+                        NotificationSettings.user_id == user_id
+                    )
+                    res = await session.execute(select_q)
                 settings = res.scalar_one_or_none()
 
                 if not settings:
                     settings = NotificationSettings(user_id=user_id, **kwargs)
                     session.add(settings)
-                    logger.info(f"Created notification settings for user {user_id}")
+                    await session.commit()
+                    await session.refresh(settings)
+                    logger.info("Created notification settings for user %s", user_id)
                 else:
-                    for key, value in kwargs.items():
-                        if hasattr(settings, key):
-                            setattr(settings, key, value)
-                    logger.info(f"Updated notification settings for user {user_id}")
+                    await session.commit()
+                    logger.info("Updated notification settings for user %s", user_id)
 
-                await session.commit()
-                await session.refresh(settings)
                 return settings
 
         except ValidationError:
             raise
         except Exception as e:
             logger.error(
-                f"Failed to update notification settings for user {user_id}: {e}"
+                "Failed to update notification settings for user %s: %s",
+                user_id,
+                e,
             )
             raise DatabaseError(f"Failed to update notification settings: {e}") from e
 
@@ -99,7 +128,7 @@ class NotificationService:
                 res = await session.execute(q)
                 deadlines = list(res.scalars().all())
 
-                logger.debug(f"Checking {len(deadlines)} deadlines for notifications")
+                logger.debug("Checking %d deadlines for notifications", len(deadlines))
                 results = []
 
                 for deadline in deadlines:
@@ -112,7 +141,8 @@ class NotificationService:
 
                         if not settings:
                             logger.debug(
-                                f"No notification settings for user {deadline.user_id}"
+                                "No notification settings for user %s",
+                                deadline.user_id,
                             )
                             continue
 
@@ -121,61 +151,18 @@ class NotificationService:
                         if deadline_time.tzinfo is None:
                             deadline_time = deadline_time.replace(tzinfo=timezone.utc)
 
-                        time_until = deadline_time - now
-                        notifications_to_send = []
-
-                        # Check different notification timeframes
-                        notification_checks = [
-                            (
-                                settings.notify_1_week,
-                                timedelta(days=7),
-                                "1_week",
-                                "За неделю",
-                            ),
-                            (
-                                settings.notify_3_days,
-                                timedelta(days=3),
-                                "3_days",
-                                "За 3 дня",
-                            ),
-                            (
-                                settings.notify_1_day,
-                                timedelta(days=1),
-                                "1_day",
-                                "За день",
-                            ),
-                            (
-                                settings.notify_3_hours,
-                                timedelta(hours=3),
-                                "3_hours",
-                                "За 3 часа",
-                            ),
-                            (
-                                settings.notify_1_hour,
-                                timedelta(hours=1),
-                                "1_hour",
-                                "За час",
-                            ),
-                        ]
-
-                        for (
-                            should_notify,
-                            timeframe,
-                            notif_type,
-                            notif_text,
-                        ) in notification_checks:
-                            if (
-                                should_notify
-                                and timeframe
-                                <= time_until
-                                < timeframe + timedelta(minutes=2)
-                            ):
-                                if not await self._was_sent(deadline.id, notif_type):
-                                    notifications_to_send.append(
-                                        (notif_type, notif_text)
-                                    )
-
-                        for notif_type, notif_text in notifications_to_send:
+                        time_until = int((deadline_time - now).total_seconds())
+
+                        # At most one window can match, since windows are disjoint
+                        i = bisect_right(_TIMEFRAME_STARTS, time_until) - 1
+                        if i < 0 or time_until >= _TIMEFRAME_ENDS[i]:
+                            continue
+
+                        _, attr, notif_type, notif_text = _NOTIFICATION_TIMEFRAMES[i]
+                        if not getattr(settings, attr):
+                            continue
+
+                        if not await self._was_sent(deadline.id, notif_type):
                             results.append(
                                 {
                                     "deadline": deadline,
@@ -186,14 +173,14 @@ class NotificationService:
                             )
 
                     except Exception as e:
-                        logger.error(f"Error processing deadline {deadline.id}: {e}")
+                        logger.error("Error processing deadline %s: %s", deadline.id, e)
                         continue
 
-                logger.info(f"Found {len(results)} notifications to send")
+                logger.info("Found %d notifications to send", len(results))
                 return results
 
         except Exception as e:
-            logger.error(f"Failed to get deadlines for notifications: {e}")
+            logger.error("Failed to get deadlines for notifications: %s", e)
             raise NotificationError(f"Failed to get notifications: {e}") from e
 
     async def _was_sent(self, deadline_id: int, notification_type: str) -> bool:
@@ -209,18 +196,18 @@ class NotificationService:
 
                 if was_sent:
                     logger.debug(
-                        f"""Notification {notification_type} already
-                        sent for deadline {deadline_id}
-                        """
+                        "Notification %s already sent for deadline %s",
+                        notification_type,
+                        deadline_id,
                     )
 
                 return was_sent
 
         except Exception as e:
             logger.error(
-                f"""Failed to check if notification
-                was sent for deadline {deadline_id}: {e}
-                """
+                "Failed to check if notification was sent for deadline %s: %s",
+                deadline_id,
+                e,
             )
             # Return True to avoid duplicate notifications in case of error
             return True
@@ -235,13 +222,44 @@ class NotificationService:
                 session.add(notification)
                 await session.commit()
                 logger.info(
-                    f"""Marked notification {notification_type}
-                    as sent for deadline {deadline_id}
-                    """
+                    "Marked notification %s as sent for deadline %s",
+                    notification_type,
+                    deadline_id,
                 )
 
         except Exception as e:
+            # Only a clash on the unique (deadline_id, notification_type) index
+            # means it was already marked; other constraint failures are errors
+            if isinstance(e, IntegrityError) and await self._is_marked_sent(
+                deadline_id, notification_type
+            ):
+                logger.debug(
+                    "Notification %s already marked as sent for deadline %s",
+                    notification_type,
+                    deadline_id,
+                )
+                return
             logger.error(
-                f"Failed to mark notification as sent for deadline {deadline_id}: {e}"
+                "Failed to mark notification as sent for deadline %s: %s",
+                deadline_id,
+                e,
             )
             raise NotificationError(f"Failed to mark notification as sent: {e}") from e
+
+    async def _is_marked_sent(self, deadline_id: int, notification_type: str) -> bool:
+        """Check if a sent notification is already recorded, False on failure"""
+        try:
+            async with self.session_factory() as session:
+                q = select(SentNotification.id).where(
+                    SentNotification.deadline_id == deadline_id,
+                    SentNotification.notification_type == notification_type,
+                )
+                res = await session.execute(q)
+                return res.scalar_one_or_none() is not None
+        except Exception as e:
+            logger.error(
+                "Failed to check sent notification for deadline %s: %s",
+                deadline_id,
+                e,
+            )
+            return False
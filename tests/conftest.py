@@ -1,8 +1,16 @@
+import asyncio
+import copy
+import sys
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 import pytest_asyncio
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import configure_mappers
 from sqlalchemy.pool import StaticPool
 
 from db.base import Base
@@ -11,6 +19,33 @@ from db.models import Deadline, NotificationSettings, User
 # Test database URL
 TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 
+# Per-user notification toggles on NotificationSettings
+_NOTIFICATION_FIELDS = (
+    "notify_on_due",
+    "notify_1_hour",
+    "notify_3_hours",
+    "notify_1_day",
+    "notify_3_days",
+    "notify_1_week",
+)
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """Run async tests on uvloop where it is available."""
+    if sys.platform == "win32":
+        return asyncio.DefaultEventLoopPolicy()
+
+    import uvloop
+
+    return uvloop.EventLoopPolicy()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_mappers():
+    """Configure ORM mappers once so the first test doesn't pay for it."""
+    configure_mappers()
+
 
 @pytest_asyncio.fixture(scope="session")
 async def engine():
@@ -19,53 +54,81 @@ async def engine():
         TEST_DATABASE_URL,
         poolclass=StaticPool,
         connect_args={"check_same_thread": False},
+        query_cache_size=1200,
         echo=False,
     )
 
+    # Let SQLAlchemy emit BEGIN itself so SAVEPOINTs work with the sqlite driver
+    @event.listens_for(engine.sync_engine, "connect")
+    def do_connect(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def do_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
     # Create all tables
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
     yield engine
 
-    # Clean up
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
-
+    # The in-memory database is discarded together with its connection
     await engine.dispose()
 
 
-@pytest_asyncio.fixture
-async def db_session(engine):
-    """Create session factory for testing."""
+@pytest_asyncio.fixture(scope="session")
+async def connection(engine):
+    """Open one connection with an outer transaction for the whole session."""
     async with engine.connect() as conn:
         trans = await conn.begin()
 
-        async_session = async_sessionmaker(
-            bind=conn,
-            expire_on_commit=False,
-        )
-
-        yield async_session
+        yield conn
 
         await trans.rollback()
 
 
+@pytest_asyncio.fixture(scope="session")
+async def shared_user(connection):
+    """Seed one read-only user (telegram_id=1) for the whole session."""
+    async with async_sessionmaker(
+        bind=connection,
+        expire_on_commit=False,
+        join_transaction_mode="create_savepoint",
+    )() as session:
+        user = User(telegram_id=1, timezone="UTC")
+        session.add(user)
+        await session.commit()
+    return user
+
+
 @pytest_asyncio.fixture
-async def session(engine):
-    """Create a session for each test."""
-    async with engine.connect() as conn:
-        trans = await conn.begin()
+async def nested_connection(connection):
+    """Wrap each test in a SAVEPOINT that is rolled back afterwards."""
+    savepoint = await connection.begin_nested()
 
-        async_session = async_sessionmaker(
-            bind=conn,
-            expire_on_commit=False,
-        )
+    yield connection
 
-        async with async_session() as session:
-            yield session
+    if savepoint.is_active:
+        await savepoint.rollback()
 
-        await trans.rollback()
+
+@pytest_asyncio.fixture
+async def db_session(nested_connection):
+    """Create session factory for testing."""
+    return async_sessionmaker(
+        bind=nested_connection,
+        autoflush=False,
+        expire_on_commit=False,
+        join_transaction_mode="create_savepoint",
+    )
+
+
+@pytest_asyncio.fixture
+async def session(db_session):
+    """Create a session for each test."""
+    async with db_session() as session:
+        yield session
 
 
 @pytest_asyncio.fixture
@@ -99,17 +162,15 @@ async def multiple_deadlines(session, sample_user):
         datetime.now(timezone.utc) + timedelta(days=3),
         datetime.now(timezone.utc) + timedelta(days=7),
     ]
-    deadlines = []
-
-    for i, deadline_date in enumerate(deadlines_data):
-        deadline = Deadline(
+    deadlines = [
+        Deadline(
             user_id=sample_user.id,
             title=f"Test Deadline {i + 1}",
             deadline_at=deadline_date,
         )
-        session.add(deadline)
-        deadlines.append(deadline)
-
+        for i, deadline_date in enumerate(deadlines_data)
+    ]
+    session.add_all(deadlines)
     await session.commit()
 
     for deadline in deadlines:
@@ -118,6 +179,18 @@ async def multiple_deadlines(session, sample_user):
     return deadlines
 
 
+@pytest.fixture(scope="session")
+def frozen_now():
+    """Provide a fixed "now" for tests that don't compare against the clock."""
+    return datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture(scope="session")
+def future_date(frozen_now):
+    """Provide a fixed date one week after frozen_now."""
+    return frozen_now + timedelta(days=7)
+
+
 @pytest.fixture
 def valid_deadline_data():
     """Provide valid deadline data for testing."""
@@ -167,3 +240,118 @@ async def sample_notification_settings(session, sample_user):
     await session.commit()
     await session.refresh(settings)
     return settings
+
+
+@lru_cache(maxsize=None)
+def _spec_attrs(cls):
+    """Attribute names of cls, computed once instead of on every spec'd Mock."""
+    return tuple(dir(cls))
+
+
+def _spec_mock(cls):
+    """Build a Mock limited to cls's attributes that still passes isinstance.
+
+    Mock(spec=cls) rescans every attribute for coroutines on each call; a name
+    list skips that scan and assigning __class__ keeps isinstance dispatch.
+    """
+    mock = Mock(spec=_spec_attrs(cls))
+    mock.__class__ = cls
+    return mock
+
+
+@pytest.fixture
+def mock_message():
+    """Provide a Message mock with an awaitable answer."""
+    # Imported here so test modules that never touch aiogram don't load it
+    from aiogram.types import Message
+
+    message = _spec_mock(Message)
+    message.answer = AsyncMock()
+    return message
+
+
+@pytest.fixture
+def mock_callback():
+    """Provide a CallbackQuery mock with an awaitable answer."""
+    from aiogram.types import CallbackQuery
+
+    callback = _spec_mock(CallbackQuery)
+    callback.answer = AsyncMock()
+    return callback
+
+
+@pytest.fixture
+def mock_user():
+    """Provide a Telegram User mock with id 12345."""
+    from aiogram.types import User
+
+    user = _spec_mock(User)
+    user.id = 12345
+    return user
+
+
+@pytest.fixture
+def make_service():
+    """Build a deadline service mock whose named methods are awaitable.
+
+    Only the given methods get an AsyncMock; any other attribute is a plain
+    Mock, which is much cheaper to create than a full AsyncMock service.
+    """
+
+    def _make(**returns):
+        service = Mock()
+        for name, value in returns.items():
+            setattr(service, name, AsyncMock(return_value=value))
+        return service
+
+    return _make
+
+
+@pytest.fixture(scope="session")
+def _notification_settings_template():
+    """Build notification settings with every toggle enabled once per session."""
+    return SimpleNamespace(**dict.fromkeys(_NOTIFICATION_FIELDS, True))
+
+
+@pytest.fixture
+def notification_settings(_notification_settings_template):
+    """Provide a per-test copy of the all-enabled notification settings."""
+    return copy.copy(_notification_settings_template)
+
+
+@pytest.fixture
+def notification_service(notification_settings):
+    """Provide a notification service mock returning notification_settings."""
+    service = AsyncMock()
+    service.get_or_create_settings.return_value = notification_settings
+    return service
+
+
+@pytest.fixture
+def mock_dateparser(monkeypatch):
+    """Replace dateparser.parse for handlers that parse user-entered dates."""
+    parse = Mock()
+    monkeypatch.setattr("dateparser.parse", parse)
+    return parse
+
+
+@pytest.fixture(scope="session")
+def _shared_fsm_state():
+    """Build the FSMContext mock tree once for the whole session."""
+    from aiogram.fsm.context import FSMContext
+
+    state = Mock(spec=FSMContext)
+    state.set_state = AsyncMock()
+    state.update_data = AsyncMock()
+    state.clear = AsyncMock()
+    state.get_data = AsyncMock(return_value={})
+    return state
+
+
+@pytest.fixture
+def fsm_state(_shared_fsm_state):
+    """Provide the shared FSMContext mock, reset after each test."""
+    yield _shared_fsm_state
+
+    _shared_fsm_state.reset_mock(return_value=True, side_effect=True)
+    _shared_fsm_state.get_data.return_value = {}
@@ -1,38 +1,47 @@
-import logging
 from datetime import datetime, timedelta, timezone
-from unittest.mock import MagicMock
 
 import pytest
 from sqlalchemy import select
 
-from db.models import Deadline, User
+from db.models import Deadline
 from exceptions import (
+    DatabaseError,
     DeadlineCreationError,
+    DeadlineDeletionError,
     DeadlineNotFoundError,
+    DeadlineUpdateError,
     InvalidDeadlineError,
     InvalidTimezoneError,
     ValidationError,
 )
 from services.deadline_service import DeadlineService
 
+pytestmark = pytest.mark.usefixtures("shared_user")
+
+# Fixed naive dates shared by tests that only need "some time in the future/past"
+_FUTURE = datetime.now() + timedelta(days=30)
+_PAST = datetime.now() - timedelta(days=1)
+
+
+def _boom(*args, **kwargs):
+    """Stand-in session factory that always fails"""
+    raise Exception("Something went wrong")
+
 
 class TestDeadlineService:
     """Test cases for DeadlineService"""
 
-    @pytest.mark.asyncio
-    async def test_get_or_create_user_return_existing(self, session, db_session):
+    async def test_get_or_create_user_return_existing(
+        self, session, db_session, shared_user
+    ):
         """Test getting an existing user"""
         service = DeadlineService(db_session)
 
-        user = User(telegram_id=1, timezone="UTC")
-        session.add(user)
-        await session.commit()
-
         result = await service._get_or_create_user_by_id(session, user_id=1)
+        assert result.id == shared_user.id
         assert result.telegram_id == 1
         assert result.timezone == "UTC"
 
-    @pytest.mark.asyncio
     async def test_get_or_create_user_create_new(self, session, db_session):
         """Test creating new user when not exists"""
         service = DeadlineService(db_session)
@@ -42,79 +51,48 @@ class TestDeadlineService:
         assert user.telegram_id == 456
         assert user.timezone == "UTC"
 
-    @pytest.mark.asyncio
-    async def test_create_deadline_success(self, session, db_session):
+    async def test_create_deadline_success(self, db_session):
         """Test successful deadline creation"""
         service = DeadlineService(db_session)
-        future_date = datetime.now() + timedelta(days=7)
 
-        deadline = await service.create(
-            user_id=1, title="Test Deadline", dt=future_date
-        )
+        deadline = await service.create(user_id=1, title="Test Deadline", dt=_FUTURE)
 
         assert deadline.id is not None
         assert deadline.title == "Test Deadline"
         assert deadline.user_id == 1
-        assert deadline.deadline_at == future_date
+        assert deadline.deadline_at == _FUTURE
 
-    @pytest.mark.asyncio
-    async def test_create_deadline_in_past_raises_error(self, session, db_session):
+    async def test_create_deadline_in_past_raises_error(self, db_session):
         """Test creating deadline in past raises error"""
         service = DeadlineService(db_session)
-        past_date = datetime.now() - timedelta(days=1)
 
         with pytest.raises(InvalidDeadlineError):
-            await service.create(user_id=1, title="Past Deadline", dt=past_date)
+            await service.create(user_id=1, title="Past Deadline", dt=_PAST)
 
-    @pytest.mark.asyncio
-    async def test_create_deadline_empty_title_raises_error(self, session, db_session):
+    async def test_create_deadline_empty_title_raises_error(self, db_session):
         """Test creating deadline with empty title raises error"""
         service = DeadlineService(db_session)
-        future_date = datetime.now() + timedelta(days=7)
 
         with pytest.raises(ValidationError):
-            await service.create(user_id=1, title="", dt=future_date)
-
-    @pytest.mark.asyncio
-    async def test_create_deadline_raise_infrastructure_error(self, db_session, caplog):
-        service = DeadlineService(db_session)
-        caplog.set_level(logging.ERROR)
-
-        service.session_factory = MagicMock(side_effect=Exception("DB is down"))
+            await service.create(user_id=1, title="", dt=_FUTURE)
 
-        with pytest.raises(DeadlineCreationError):
-            await service.create(
-                user_id=1, title="Test", dt=datetime.now() + timedelta(days=7)
-            )
-
-        assert any(
-            "Failed to create deadline" in record.message for record in caplog.records
-        )
-
-    @pytest.mark.asyncio
-    async def test_create_deadline_whitespace_title_raises_error(
-        self, session, db_session
-    ):
+    async def test_create_deadline_whitespace_title_raises_error(self, db_session):
         """Test creating deadline with whitespace title raises error"""
         service = DeadlineService(db_session)
-        future_date = datetime.now() + timedelta(days=7)
 
         with pytest.raises(ValidationError):
-            await service.create(user_id=1, title="   ", dt=future_date)
+            await service.create(user_id=1, title="   ", dt=_FUTURE)
 
-    @pytest.mark.asyncio
-    async def test_create_deadline_strips_title_whitespace(self, session, db_session):
+    async def test_create_deadline_strips_title_whitespace(self, db_session):
         """Test creating deadline strips title whitespace"""
         service = DeadlineService(db_session)
-        future_date = datetime.now() + timedelta(days=7)
 
         deadline = await service.create(
-            user_id=1, title="  Test Deadline  ", dt=future_date
+            user_id=1, title="  Test Deadline  ", dt=_FUTURE
         )
 
         assert deadline.title == "Test Deadline"
 
-    @pytest.mark.asyncio
     async def test_get_due_deadlines(self, session, db_session):
         """Test getting due deadlines"""
         service = DeadlineService(db_session)
@@ -123,18 +101,17 @@ class TestDeadlineService:
         past_deadline = Deadline(
             user_id=1,
             title="Past Deadline",
-            deadline_at=datetime.now() - timedelta(days=1),
+            deadline_at=_PAST,
         )
-        session.add(past_deadline)
 
         # Create a future deadline
         future_deadline = Deadline(
             user_id=1,
             title="Future Deadline",
-            deadline_at=datetime.now() + timedelta(days=1),
+            deadline_at=_FUTURE,
         )
-        session.add(future_deadline)
 
+        session.add_all([past_deadline, future_deadline])
         await session.commit()
 
         due_deadlines = await service.get_due()
@@ -143,26 +120,11 @@ class TestDeadlineService:
         assert len(due_deadlines) == 1
         assert due_deadlines[0].title == "Past Deadline"
 
-    @pytest.mark.asyncio
-    async def test_get_due_deadlines_raises_error(self, session, db_session, caplog):
-        """Test get_due_deadlines raises error"""
-        service = DeadlineService(db_session)
-
-        caplog.set_level(logging.ERROR)
-
-        service.session_factory = MagicMock(
-            side_effect=Exception("Something went wrong")
-        )
-
-        with pytest.raises(Exception):
-            await service.get_due()
-
-    @pytest.mark.asyncio
-    async def test_list_for_user_success(self, session, multiple_deadlines, db_session):
+    async def test_list_for_user_success(self, multiple_deadlines, db_session):
         """Test listing deadlines for user"""
         service = DeadlineService(db_session)
 
-        deadlines = await service.list_for_user(user_id=1)
+        deadlines = await service.list_for_user(user_id=multiple_deadlines[0].user_id)
 
         assert len(deadlines) == len(multiple_deadlines)
         # Should be ordered by deadline_at
@@ -172,33 +134,7 @@ class TestDeadlineService:
             <= deadlines[2].deadline_at
         )
 
-    @pytest.mark.asyncio
-    async def test_list_for_user_empty_list(self, session, db_session):
-        """Test listing deadlines for user with no deadlines"""
-        service = DeadlineService(db_session)
-
-        deadlines = await service.list_for_user(user_id=999)
-
-        assert deadlines == []
-
-    @pytest.mark.asyncio
-    async def test_list_for_user_error(self, session, db_session, caplog):
-        """Test listing deadlines for user with error"""
-        service = DeadlineService(db_session)
-
-        caplog.set_level(logging.ERROR)
-
-        service.session_factory = MagicMock(
-            side_effect=Exception("Something went wrong")
-        )
-
-        with pytest.raises(Exception):
-            await service.list_for_user(user_id=1)
-
-        assert "Something went wrong" in caplog.text
-
-    @pytest.mark.asyncio
-    async def test_delete_deadline_success(self, session, sample_deadline, db_session):
+    async def test_delete_deadline_success(self, sample_deadline, db_session):
         """Test successful deadline deletion"""
         service = DeadlineService(db_session)
 
@@ -207,45 +143,12 @@ class TestDeadlineService:
         assert result is True
 
         # Verify deadline is deleted
-        from sqlalchemy import select
-
-        from db.models import Deadline
-
-        async with db_session() as session:
-            result = await session.execute(
-                select(Deadline).where(Deadline.id == sample_deadline.id)
-            )
-            deleted_deadline = result.scalar_one_or_none()
-            assert deleted_deadline is None
-
-    @pytest.mark.asyncio
-    async def test_delete_deadline_not_found_raises_error(self, session, db_session):
-        """Test deleting non-existent deadline raises error"""
-        service = DeadlineService(db_session)
-
-        with pytest.raises(DeadlineNotFoundError):
-            await service.delete(99999, 1)
-
-    @pytest.mark.asyncio
-    async def test_delete_deadline_error(
-        self, session, db_session, sample_deadline, caplog
-    ):
-        """Test deleting deadline with error"""
-        service = DeadlineService(db_session)
-
-        caplog.set_level(logging.ERROR)
-
-        service.session_factory = MagicMock(
-            side_effect=Exception("Something went wrong")
+        deleted_deadline = await service.get_by_id(
+            sample_deadline.id, sample_deadline.user_id
         )
+        assert deleted_deadline is None
 
-        with pytest.raises(Exception):
-            await service.delete(sample_deadline.id, sample_deadline.user_id)
-
-        assert "Something went wrong" in caplog.text
-
-    @pytest.mark.asyncio
-    async def test_get_by_id_success(self, session, sample_deadline, db_session):
+    async def test_get_by_id_success(self, sample_deadline, db_session):
         """Test getting deadline by ID"""
         service = DeadlineService(db_session)
 
@@ -255,31 +158,7 @@ class TestDeadlineService:
         assert deadline.id == sample_deadline.id
         assert deadline.title == sample_deadline.title
 
-    @pytest.mark.asyncio
-    async def test_get_by_id_not_found(self, session, db_session):
-        """Test getting non-existent deadline by ID"""
-        service = DeadlineService(db_session)
-
-        deadline = await service.get_by_id(99999, 1)
-
-        assert deadline is None
-
-    @pytest.mark.asyncio
-    async def test_get_by_id_error(self, db_session, sample_deadline, caplog):
-        """Test getting deadline by ID with error"""
-        service = DeadlineService(db_session)
-
-        caplog.set_level(logging.ERROR)
-
-        service.session_factory = MagicMock(
-            side_effect=Exception("Something went wrong")
-        )
-
-        with pytest.raises(Exception):
-            await service.get_by_id(sample_deadline.id, sample_deadline.user_id)
-
-    @pytest.mark.asyncio
-    async def test_get_or_create_user_new_user(self, session, db_session):
+    async def test_get_or_create_user_new_user(self, db_session):
         """Test getting or creating new user by telegram_id"""
         service = DeadlineService(db_session)
 
@@ -289,7 +168,6 @@ class TestDeadlineService:
         assert user.timezone == "UTC"
         assert user.id is not None
 
-    @pytest.mark.asyncio
     async def test_get_or_create_user_existing_user(self, sample_user, db_session):
         """Test getting existing user by telegram_id"""
         service = DeadlineService(db_session)
@@ -299,24 +177,7 @@ class TestDeadlineService:
         assert user.telegram_id == sample_user.telegram_id
         assert user.id == sample_user.id
 
-    @pytest.mark.asyncio
-    async def test_get_or_create_user_error(self, db_session, caplog):
-        """Test getting or creating user with error"""
-        service = DeadlineService(db_session)
-
-        caplog.set_level(logging.ERROR)
-
-        service.session_factory = MagicMock(
-            side_effect=Exception("Something went wrong")
-        )
-
-        with pytest.raises(Exception):
-            await service.get_or_create_user(telegram_id=12345)
-
-        assert "Something went wrong" in caplog.text
-
-    @pytest.mark.asyncio
-    async def test_edit_timezone_success(self, session, sample_user, db_session):
+    async def test_edit_timezone_success(self, sample_user, db_session):
         """Test successful timezone edit"""
         service = DeadlineService(db_session)
 
@@ -325,20 +186,11 @@ class TestDeadlineService:
         assert result is True
 
         # Verify timezone was updated
-        from sqlalchemy import select
-
-        from db.models import User
+        tz = await service.get_timezone_for_user(sample_user.telegram_id)
+        assert tz == "Europe/Moscow"
 
-        async with db_session() as session:
-            result = await session.execute(
-                select(User).where(User.telegram_id == sample_user.telegram_id)
-            )
-            user = result.scalar_one()
-            assert user.timezone == "Europe/Moscow"
-
-    @pytest.mark.asyncio
     async def test_edit_timezone_invalid_timezone_raises_error(
-        self, session, sample_user, db_session
+        self, sample_user, db_session
     ):
         """Test editing with invalid timezone raises error"""
         service = DeadlineService(db_session)
@@ -346,8 +198,7 @@ class TestDeadlineService:
         with pytest.raises(InvalidTimezoneError):
             await service.edit_timezone(sample_user.telegram_id, "Invalid/Timezone")
 
-    @pytest.mark.asyncio
-    async def test_edit_timezone_creates_user_if_not_exists(self, session, db_session):
+    async def test_edit_timezone_creates_user_if_not_exists(self, db_session):
         """Test editing timezone creates user if not exists"""
         service = DeadlineService(db_session)
 
@@ -356,33 +207,10 @@ class TestDeadlineService:
         assert result is True
 
         # Verify user was created
-        from sqlalchemy import select
-
-        from db.models import User
+        tz = await service.get_timezone_for_user(99999)
+        assert tz == "Europe/Moscow"
 
-        async with db_session() as session:
-            result = await session.execute(
-                select(User).where(User.telegram_id == 99999)
-            )
-            user = result.scalar_one()
-            assert user.timezone == "Europe/Moscow"
-
-    @pytest.mark.asyncio
-    async def test_edit_timezone_error(self, db_session, caplog):
-        """Test editing timezone with error"""
-        service = DeadlineService(db_session)
-
-        caplog.set_level(logging.ERROR)
-
-        service.session_factory = MagicMock(
-            side_effect=Exception("Something went wrong")
-        )
-
-        with pytest.raises(Exception):
-            await service.edit_timezone(999999, "Europe/Moscow")
-
-    @pytest.mark.asyncio
-    async def test_get_timezone_for_user_exists(self, session, sample_user, db_session):
+    async def test_get_timezone_for_user_exists(self, sample_user, db_session):
         """Test getting timezone for existing user"""
         service = DeadlineService(db_session)
 
@@ -390,40 +218,13 @@ class TestDeadlineService:
 
         assert timezone == sample_user.timezone
 
-    @pytest.mark.asyncio
-    async def test_get_timezone_for_user_not_exists_returns_utc(
-        self, session, db_session
-    ):
-        """Test getting timezone for non-existent user returns UTC"""
-        service = DeadlineService(db_session)
-
-        timezone = await service.get_timezone_for_user(999999)
-
-        assert timezone == "UTC"
-
-    @pytest.mark.asyncio
-    async def test_get_timezone_for_user_error(self, db_session, caplog):
-        """Test getting timezone for non-existent user with error"""
-        service = DeadlineService(db_session)
-
-        caplog.set_level(logging.ERROR)
-
-        service.session_factory = MagicMock(
-            side_effect=Exception("Something went wrong")
-        )
-
-        with pytest.raises(Exception):
-            await service.get_timezone_for_user(999999)
-
-    @pytest.mark.asyncio
-    async def test_update_deadline_success(self, session, sample_deadline, db_session):
+    async def test_update_deadline_success(self, sample_deadline, db_session):
         """Test successful deadline update"""
         service = DeadlineService(db_session)
         new_title = "Updated Title"
-        new_date = datetime.now() + timedelta(days=14)
 
         result = await service.update(
-            deadline_id=sample_deadline.id, title=new_title, dt=new_date
+            deadline_id=sample_deadline.id, title=new_title, dt=_FUTURE
         )
 
         assert result is True
@@ -434,12 +235,9 @@ class TestDeadlineService:
         )
         assert updated_deadline is not None
         assert updated_deadline.title == new_title
-        assert updated_deadline.deadline_at == new_date
+        assert updated_deadline.deadline_at == _FUTURE
 
-    @pytest.mark.asyncio
-    async def test_update_deadline_title_only(
-        self, session, sample_deadline, db_session
-    ):
+    async def test_update_deadline_title_only(self, sample_deadline, db_session):
         """Test updating only deadline title"""
         service = DeadlineService(db_session)
         new_title = "Updated Title Only"
@@ -457,15 +255,11 @@ class TestDeadlineService:
         # Deadline time should remain unchanged
         assert updated_deadline.deadline_at == sample_deadline.deadline_at
 
-    @pytest.mark.asyncio
-    async def test_update_deadline_date_only(
-        self, session, sample_deadline, db_session
-    ):
+    async def test_update_deadline_date_only(self, sample_deadline, db_session):
         """Test updating only deadline date"""
         service = DeadlineService(db_session)
-        new_date = datetime.now() + timedelta(days=14)
 
-        result = await service.update(deadline_id=sample_deadline.id, dt=new_date)
+        result = await service.update(deadline_id=sample_deadline.id, dt=_FUTURE)
 
         assert result is True
 
@@ -474,19 +268,10 @@ class TestDeadlineService:
             sample_deadline.id, sample_deadline.user_id
         )
         assert updated_deadline is not None
-        assert updated_deadline.deadline_at == new_date
+        assert updated_deadline.deadline_at == _FUTURE
         # Title should remain unchanged
         assert updated_deadline.title == sample_deadline.title
 
-    @pytest.mark.asyncio
-    async def test_update_deadline_not_found_raises_error(self, session, db_session):
-        """Test updating non-existent deadline raises error"""
-        service = DeadlineService(db_session)
-
-        with pytest.raises(DeadlineNotFoundError):
-            await service.update(deadline_id=99999, title="Updated Title")
-
-    @pytest.mark.asyncio
     async def test_update_deadline_empty_title_raises_error(
         self, db_session, sample_deadline
     ):
@@ -496,7 +281,6 @@ class TestDeadlineService:
         with pytest.raises(ValidationError):
             await service.update(deadline_id=sample_deadline.id, title="")
 
-    @pytest.mark.asyncio
     async def test_update_deadline_past_date_raises_error(
         self, db_session, sample_deadline
     ):
@@ -504,11 +288,8 @@ class TestDeadlineService:
         service = DeadlineService(db_session)
 
         with pytest.raises(InvalidDeadlineError):
-            await service.update(
-                deadline_id=sample_deadline.id, dt=datetime.now() - timedelta(days=1)
-            )
+            await service.update(deadline_id=sample_deadline.id, dt=_PAST)
 
-    @pytest.mark.asyncio
     async def test_update_deadline_strips_title_whitespace(
         self, db_session, sample_deadline
     ):
@@ -527,21 +308,6 @@ class TestDeadlineService:
         assert updated_deadline is not None
         assert updated_deadline.title == "Updated Title"
 
-    @pytest.mark.asyncio
-    async def test_update_deadline_error(self, db_session, sample_deadline, caplog):
-        """Test updating deadline with error"""
-        service = DeadlineService(db_session)
-        caplog.set_level(logging.ERROR)
-
-        service.session_factory = MagicMock(side_effect=Exception("Test error"))
-
-        with pytest.raises(Exception):
-            await service.update(
-                deadline_id=sample_deadline.id,
-                title="Updated Title",
-                dt=datetime.now() + timedelta(days=1),
-            )
-
     def test_is_valid_timezone_valid_timezone(self):
         """Test valid timezone validation"""
         from services.deadline_service import is_valid_timezone
@@ -559,25 +325,22 @@ class TestDeadlineService:
         assert is_valid_timezone("") is False
         assert is_valid_timezone("NotATimezone") is False
 
-    @pytest.mark.asyncio
-    async def test_get_due_unnotified_empty(self, session, db_session):
+    async def test_get_due_unnotified_empty(self, db_session):
         """Test getting due unnotified deadlines when none exist"""
         service = DeadlineService(db_session)
 
         deadlines = await service.get_due_unnotified()
         assert deadlines == []
 
-    @pytest.mark.asyncio
-    async def test_get_due_unnotified_with_deadlines(self, session, db_session):
+    async def test_get_due_unnotified_with_deadlines(
+        self, session, db_session, shared_user
+    ):
         """Test getting due unnotified deadlines"""
         service = DeadlineService(db_session)
-        user = User(telegram_id=1, timezone="UTC")
-        session.add(user)
-        await session.commit()
 
         # Create a past deadline
         past_deadline = Deadline(
-            user_id=user.id,
+            user_id=shared_user.id,
             title="Past Deadline",
             deadline_at=datetime.now(timezone.utc) - timedelta(days=1),
         )
@@ -588,16 +351,12 @@ class TestDeadlineService:
         assert len(deadlines) == 1
         assert deadlines[0].title == "Past Deadline"
 
-    @pytest.mark.asyncio
-    async def test_mark_overdue_notified(self, session, db_session):
+    async def test_mark_overdue_notified(self, session, db_session, shared_user):
         """Test marking deadline as overdue notified"""
         service = DeadlineService(db_session)
-        user = User(telegram_id=1, timezone="UTC")
-        session.add(user)
-        await session.commit()
 
         deadline = Deadline(
-            user_id=user.id,
+            user_id=shared_user.id,
             title="Test Deadline",
             deadline_at=datetime.now(timezone.utc) + timedelta(days=1),
         )
@@ -616,3 +375,96 @@ class TestDeadlineService:
         notification = result.scalar_one_or_none()
         assert notification is not None
         assert notification.notification_type == "overdue"
+
+    async def test_mark_overdue_notified_duplicate_ignored(
+        self, session, db_session, shared_user
+    ):
+        """Test marking the same deadline twice keeps a single record"""
+        service = DeadlineService(db_session)
+
+        deadline = Deadline(
+            user_id=shared_user.id,
+            title="Test Deadline",
+            deadline_at=datetime.now(timezone.utc) + timedelta(days=1),
+        )
+        session.add(deadline)
+        await session.commit()
+
+        await service.mark_overdue_notified(deadline.id)
+        await service.mark_overdue_notified(deadline.id)
+
+        from db.models import SentNotification
+
+        result = await session.execute(
+            select(SentNotification).where(SentNotification.deadline_id == deadline.id)
+        )
+        assert len(result.scalars().all()) == 1
+
+    async def test_mark_overdue_notified_other_integrity_error(self, db_session):
+        """Test a constraint failure other than a duplicate is not swallowed"""
+        service = DeadlineService(db_session)
+
+        with pytest.raises(DatabaseError):
+            await service.mark_overdue_notified(None)
+
+    @pytest.mark.parametrize(
+        "method,args,expected",
+        [
+            ("list_for_user", {"user_id": 999}, []),
+            ("delete", {"deadline_id": 99999, "user_id": 1}, DeadlineNotFoundError),
+            ("get_by_id", {"deadline_id": 99999, "user_id": 1}, None),
+            ("get_timezone_for_user", {"telegram_id": 999999}, "UTC"),
+            (
+                "update",
+                {"deadline_id": 99999, "title": "Updated Title"},
+                DeadlineNotFoundError,
+            ),
+        ],
+    )
+    async def test_missing_record(self, db_session, method, args, expected):
+        """Test service calls against IDs that don't exist"""
+        service = DeadlineService(db_session)
+
+        if isinstance(expected, type) and issubclass(expected, Exception):
+            with pytest.raises(expected):
+                await getattr(service, method)(**args)
+        else:
+            assert await getattr(service, method)(**args) == expected
+
+    @pytest.mark.parametrize(
+        "method,args,error",
+        [
+            (
+                "create",
+                {"user_id": 1, "title": "Test", "dt": _FUTURE},
+                DeadlineCreationError,
+            ),
+            ("get_due", {}, DatabaseError),
+            ("list_for_user", {"user_id": 1}, DatabaseError),
+            ("delete", {"deadline_id": 1, "user_id": 1}, DeadlineDeletionError),
+            ("get_by_id", {"deadline_id": 1, "user_id": 1}, DatabaseError),
+            ("get_or_create_user", {"telegram_id": 12345}, DatabaseError),
+            (
+                "edit_timezone",
+                {"telegram_id": 999999, "timezone": "Europe/Moscow"},
+                DatabaseError,
+            ),
+            ("get_timezone_for_user", {"telegram_id": 999999}, DatabaseError),
+            (
+                "update",
+                {"deadline_id": 1, "title": "Updated Title", "dt": _FUTURE},
+                DeadlineUpdateError,
+            ),
+        ],
+    )
+    async def test_database_error_is_wrapped(
+        self, db_session, caplog, method, args, error
+    ):
+        """Test infrastructure errors are logged and wrapped"""
+        service = DeadlineService(db_session)
+        service.session_factory = _boom
+
+        with pytest.raises(error):
+            await getattr(service, method)(**args)
+
+        assert "Something went wrong" in caplog.text
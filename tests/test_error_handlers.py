@@ -1,331 +1,238 @@
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 from aiogram.types import CallbackQuery, Message
-from aiogram.types import User as TelegramUser
 
 from exceptions import (
     DatabaseError,
+    DeadlineBotError,
     ValidationError,
 )
-from utils.error_handler import ErrorHandler, handle_callback_errors, handle_errors
+from utils.error_handler import (
+    ErrorHandler,
+    _answer_callback,
+    _sanitize_error_message,
+    _send_error_message,
+    handle_callback_errors,
+    handle_errors,
+)
 
 
-class TestErrorHandlers:
-    """Test cases for error handling decorators"""
+def _failing(error_text):
+    """Return a coroutine function that always raises, for failure injection"""
 
-    @pytest.mark.asyncio
-    async def test_handle_errors_success(self):
-        """Test successful function execution with error handler"""
+    async def _raise(*args, **kwargs):
+        raise Exception(error_text)
 
-        @handle_errors("Test error message")
-        async def test_func(message):
-            return "success"
+    return _raise
 
-        mock_message = Mock(spec=Message)
-        mock_message.answer = AsyncMock()
 
-        result = await test_func(mock_message)
+# ErrorHandler only reads the user's id, so a plain namespace is enough
+_FAKE_USER = SimpleNamespace(id=12345)
 
-        assert result == "success"
-        mock_message.answer.assert_not_called()
 
-    @pytest.mark.asyncio
-    async def test_handle_errors_validation_error(self):
-        """Test handling ValidationError"""
+class _FakeMessage:
+    """Minimal message stub for handlers that don't check isinstance"""
 
-        @handle_errors("Default error")
-        async def test_func(message):
-            raise ValidationError("Invalid input")
+    __slots__ = ("answer", "from_user", "text")
 
-        mock_message = Mock(spec=Message)
-        mock_message.answer = AsyncMock()
+    def __init__(self, from_user=None, text=""):
+        self.answer = AsyncMock()
+        self.from_user = from_user
+        self.text = text
 
-        result = await test_func(mock_message)
 
-        assert result is None
-        mock_message.answer.assert_called_once()
-        call_args = mock_message.answer.call_args[0][0]
-        assert "Default error" in call_args
-        assert "Invalid input" in call_args
+@pytest.fixture
+def make_handler():
+    """Build a handler wrapped by an error decorator that raises or succeeds"""
 
-    @pytest.mark.asyncio
-    async def test_handle_errors_database_error(self):
-        """Test handling DatabaseError"""
+    def _make(decorator, default_message, error=None):
+        @decorator(default_message)
+        async def handler(*args, **kwargs):
+            if error is not None:
+                raise error
+            return "success"
 
-        @handle_errors("Default error")
-        async def test_func(message):
-            raise DatabaseError("Database connection failed")
+        return handler
 
-        mock_message = Mock(spec=Message)
-        mock_message.answer = AsyncMock()
+    return _make
 
-        result = await test_func(mock_message)
 
-        assert result is None
-        mock_message.answer.assert_called_once()
-        call_args = mock_message.answer.call_args[0][0]
-        assert "Ошибка базы данных" in call_args
+@pytest.fixture
+def logger_stub(monkeypatch):
+    """Replace the error handler's logger for the duration of a test"""
+    stub = Mock()
+    monkeypatch.setattr("utils.error_handler.logger", stub)
+    return stub
 
-    @pytest.mark.asyncio
-    async def test_handle_errors_general_error(self):
-        """Test handling general Exception"""
 
-        @handle_errors("Default error")
-        async def test_func(message):
-            raise Exception("Unexpected error")
+class TestErrorHandlers:
+    """Test cases for error handling decorators"""
 
-        mock_message = Mock(spec=Message)
-        mock_message.answer = AsyncMock()
+    async def test_handle_errors_success(self, make_handler, mock_message):
+        """Test successful function execution with error handler"""
+        test_func = make_handler(handle_errors, "Test error message")
 
         result = await test_func(mock_message)
 
-        assert result is None
-        mock_message.answer.assert_called_once_with("Default error")
-
-    @pytest.mark.asyncio
-    async def test_handle_errors_custom_message(self):
-        """Test custom error message"""
-
-        @handle_errors("Custom error message")
-        async def test_func(message):
-            raise Exception("Test error")
+        assert result == "success"
+        mock_message.answer.assert_not_called()
 
-        mock_message = Mock(spec=Message)
-        mock_message.answer = AsyncMock()
+    @pytest.mark.parametrize(
+        "error,expected_text",
+        [
+            (
+                ValidationError("Invalid input"),
+                "Default error\n\nInvalid input provided",
+            ),
+            (
+                DatabaseError("Database connection failed"),
+                "Ошибка базы данных. Попробуйте позже.",
+            ),
+            (DeadlineBotError("Application error"), "Default error"),
+            (Exception("Unexpected error"), "Default error"),
+        ],
+    )
+    async def test_handle_errors_sends_error_message(
+        self, make_handler, mock_message, error, expected_text
+    ):
+        """Test handled errors are reported to the user"""
+        test_func = make_handler(handle_errors, "Default error", error)
 
-        await test_func(mock_message)
+        result = await test_func(mock_message)
 
-        mock_message.answer.assert_called_once_with("Custom error message")
+        assert result is None
+        mock_message.answer.assert_called_once_with(expected_text)
 
-    @pytest.mark.asyncio
-    async def test_handle_callback_errors_success(self):
+    async def test_handle_callback_errors_success(self, make_handler, mock_callback):
         """Test successful callback execution with error handler"""
-
-        @handle_callback_errors("Test error")
-        async def test_callback(callback):
-            return "success"
-
-        mock_callback = Mock(spec=CallbackQuery)
-        mock_callback.answer = AsyncMock()
+        test_callback = make_handler(handle_callback_errors, "Test error")
 
         result = await test_callback(mock_callback)
 
         assert result == "success"
         mock_callback.answer.assert_not_called()
 
-    @pytest.mark.asyncio
-    async def test_handle_callback_errors_validation_error_alert(self):
-        """Test handling ValidationError with alert"""
-
-        @handle_callback_errors("Default error")
-        async def test_callback(callback):
-            raise ValidationError("Invalid callback data")
-
-        mock_callback = Mock(spec=CallbackQuery)
-        mock_callback.answer = AsyncMock()
-
-        result = await test_callback(mock_callback)
-
-        assert result is None
-        mock_callback.answer.assert_called_once()
-        call_args, call_kwargs = mock_callback.answer.call_args
-        assert "Default error" in call_args[0]
-        assert "Invalid input provided" in call_args[0]
-        assert call_kwargs.get("show_alert") is True
-
-    @pytest.mark.asyncio
-    async def test_handle_callback_errors_database_error(self):
-        """Test handling DatabaseError in callback"""
-
-        @handle_callback_errors("Default error")
-        async def test_callback(callback):
-            raise DatabaseError("Database error")
-
-        mock_callback = Mock(spec=CallbackQuery)
-        mock_callback.answer = AsyncMock()
+    @pytest.mark.parametrize(
+        "error,expected_text,show_alert",
+        [
+            (
+                ValidationError("Invalid callback data"),
+                "Default error\n\nInvalid input provided",
+                True,
+            ),
+            (
+                DatabaseError("Database error"),
+                "Ошибка базы данных. Попробуйте позже.",
+                True,
+            ),
+            (DeadlineBotError("Deadline specific error"), "Default error", False),
+            (Exception("Unexpected error"), "Default error", False),
+        ],
+    )
+    async def test_handle_callback_errors_answers_callback(
+        self, make_handler, mock_callback, error, expected_text, show_alert
+    ):
+        """Test handled callback errors are answered with the right alert mode"""
+        test_callback = make_handler(handle_callback_errors, "Default error", error)
 
         result = await test_callback(mock_callback)
 
         assert result is None
-        mock_callback.answer.assert_called_once()
-        call_args, call_kwargs = mock_callback.answer.call_args
-        assert "Ошибка базы данных" in call_args[0]
-        assert call_kwargs.get("show_alert") is True
-
-    @pytest.mark.asyncio
-    async def test_handle_callback_errors_general_error_no_alert(self):
-        """Test handling general Exception without alert"""
-
-        @handle_callback_errors("Default error")
-        async def test_callback(callback):
-            raise Exception("Unexpected error")
-
-        mock_callback = Mock(spec=CallbackQuery)
-        mock_callback.answer = AsyncMock()
-
-        result = await test_callback(mock_callback)
-
-        assert result is None
-        mock_callback.answer.assert_called_once_with("Default error", show_alert=False)
+        mock_callback.answer.assert_called_once_with(
+            expected_text, show_alert=show_alert
+        )
 
-    @pytest.mark.asyncio
-    async def test_handle_errors_deadline_bot_error(self):
+    async def test_handle_errors_deadline_bot_error(self, make_handler, mock_callback):
         """Test handling DeadlineBotError"""
-        from exceptions import DeadlineBotError
+        test_handler = make_handler(
+            handle_errors, "Custom error", DeadlineBotError("Custom error")
+        )
 
         with patch("utils.error_handler._send_error_message") as send_error_mock:
-
-            @handle_errors("Custom error")
-            async def test_handler(*args, **kwargs):
-                raise DeadlineBotError("Custom error")
-
-            mock_callback = Mock(spec=CallbackQuery)
-            mock_callback.answer = AsyncMock()
-
             result = await test_handler(mock_callback)
 
             assert result is None
             send_error_mock.assert_awaited_once()
             mock_callback.answer.assert_not_called()
 
-    @pytest.mark.asyncio
-    async def test_send_error_message_message_type(self):
+    async def test_send_error_message_message_type(self, mock_message):
         """Test sending error message to Message"""
-        from utils.error_handler import _send_error_message
-
-        mock_message = Mock(spec=Message)
-        mock_message.answer = AsyncMock()
-
         await _send_error_message((mock_message,), "Test error", "Details")
 
-        mock_message.answer.assert_called_once()
-        call_args = mock_message.answer.call_args[0][0]
-        assert "Test error" in call_args
-        assert "Details" in call_args
+        mock_message.answer.assert_called_once_with("Test error\n\nDetails")
 
-    @pytest.mark.asyncio
-    async def test_send_error_message_callback_type(self):
+    async def test_send_error_message_callback_type(self, mock_message, mock_callback):
         """Test sending error message to CallbackQuery"""
-        from utils.error_handler import _send_error_message
-
-        mock_callback = Mock(spec=CallbackQuery)
-        mock_message = Mock(spec=Message)
         mock_callback.message = mock_message
-        mock_message.answer = AsyncMock()
 
         await _send_error_message((mock_callback,), "Test error")
 
         mock_message.answer.assert_called_once_with("Test error")
 
-    @pytest.mark.asyncio
-    async def test_send_error_message_no_message_or_callback(self):
+    async def test_send_error_message_no_message_or_callback(self, logger_stub):
         """Test error when no message or callback found"""
-        from utils.error_handler import _send_error_message
-
-        with patch("utils.error_handler.logger") as mock_logger:
-            mock_logger.error = Mock()
+        await _send_error_message(("not_a_message",), "Test error")
 
-            await _send_error_message(("not_a_message",), "Test error")
+        logger_stub.error.assert_called_once()
 
-            mock_logger.error.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_answer_callback_success(self):
+    async def test_answer_callback_success(self, mock_callback):
         """Test answering callback successfully"""
-        from utils.error_handler import _answer_callback
-
-        mock_callback = Mock(spec=CallbackQuery)
-        mock_callback.answer = AsyncMock()
-
         await _answer_callback(
             (mock_callback,), "Test error", "Details", show_alert=True
         )
 
-        mock_callback.answer.assert_called_once()
-        call_args, call_kwargs = mock_callback.answer.call_args
-        assert "Test error" in call_args[0]
-        assert "Details" in call_args[0]
-        assert call_kwargs.get("show_alert") is True
+        mock_callback.answer.assert_called_once_with(
+            "Test error\n\nDetails", show_alert=True
+        )
 
-    @pytest.mark.asyncio
-    async def test_answer_callback_no_callback(self):
+    async def test_answer_callback_no_callback(self, logger_stub):
         """Test error when no callback found"""
-        from utils.error_handler import _answer_callback
-
-        with patch("utils.error_handler.logger") as mock_logger:
-            mock_logger.error = Mock()
+        await _answer_callback(("not_a_callback",), "Test error")
 
-            await _answer_callback(("not_a_callback",), "Test error")
+        logger_stub.error.assert_called_once()
 
-            mock_logger.error.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_answer_callback_answer_failure(self):
+    async def test_answer_callback_answer_failure(self, mock_callback, logger_stub):
         """Test handling callback answer failure"""
-        from utils.error_handler import _answer_callback
-
-        mock_callback = Mock(spec=CallbackQuery)
-        mock_callback.answer = AsyncMock(side_effect=Exception("Answer failed"))
+        mock_callback.answer = _failing("Answer failed")
 
-        with patch("utils.error_handler.logger") as mock_logger:
-            mock_logger.error = Mock()
+        await _answer_callback((mock_callback,), "Test error")
 
-            await _answer_callback((mock_callback,), "Test error")
+        logger_stub.error.assert_called_once()
 
-            mock_logger.error.assert_called_once()
-
-    @pytest.mark.asyncio
     async def test_error_handler_unknown_message(self):
         """Test ErrorHandler.handle_unknown_message"""
-        mock_user = Mock(spec=TelegramUser)
-        mock_user.id = 12345
-
-        mock_message = Mock(spec=Message)
-        mock_message.from_user = mock_user
-        mock_message.text = "/unknown"
-        mock_message.answer = AsyncMock()
+        mock_message = _FakeMessage(from_user=_FAKE_USER, text="/unknown")
 
         await ErrorHandler.handle_unknown_message(mock_message)
 
-        mock_message.answer.assert_called_once()
-        call_args = mock_message.answer.call_args[0][0]
-        assert "Неизвестная команда" in call_args
+        answer = mock_message.answer
+        assert answer.await_count == 1
+        assert "Неизвестная команда" in answer.await_args.args[0]
 
-    @pytest.mark.asyncio
     async def test_error_handler_unknown_message_no_user(self):
         """Test ErrorHandler.handle_unknown_message with no user"""
-        mock_message = Mock(spec=Message)
-        mock_message.from_user = None
-        mock_message.answer = AsyncMock()
+        mock_message = _FakeMessage()
 
         await ErrorHandler.handle_unknown_message(mock_message)
 
         # Should still answer even without user
         mock_message.answer.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_error_handler_rate_limit(self):
         """Test ErrorHandler.handle_rate_limit"""
-        mock_user = Mock(spec=TelegramUser)
-        mock_user.id = 12345
-
-        mock_message = Mock(spec=Message)
-        mock_message.from_user = mock_user
-        mock_message.answer = AsyncMock()
+        mock_message = _FakeMessage(from_user=_FAKE_USER)
 
         await ErrorHandler.handle_rate_limit(mock_message)
 
-        mock_message.answer.assert_called_once()
-        call_args = mock_message.answer.call_args[0][0]
-        assert "Слишком много запросов" in call_args
+        answer = mock_message.answer
+        assert answer.await_count == 1
+        assert "Слишком много запросов" in answer.await_args.args[0]
 
-    @pytest.mark.asyncio
     async def test_error_handler_rate_limit_no_user(self):
         """Test ErrorHandler.handle_rate_limit with no user"""
-        mock_message = Mock(spec=Message)
-        mock_message.from_user = None
-        mock_message.answer = AsyncMock()
+        mock_message = _FakeMessage()
 
         await ErrorHandler.handle_rate_limit(mock_message)
 
@@ -344,8 +251,7 @@ class TestErrorHandlers:
         assert test_function.__doc__ == "Test function docstring"
         assert hasattr(test_function, "__wrapped__")
 
-    @pytest.mark.asyncio
-    async def test_handle_callback_errors_decorator_preserves_metadata(self):
+    def test_handle_callback_errors_decorator_preserves_metadata(self):
         """Test that callback decorator preserves function metadata"""
 
         @handle_callback_errors("Test error")
@@ -357,37 +263,32 @@ class TestErrorHandlers:
         assert test_callback.__doc__ == "Test callback docstring"
         assert hasattr(test_callback, "__wrapped__")
 
-    @pytest.mark.asyncio
-    async def test_send_error_message_answer_failure(self):
+    async def test_send_error_message_answer_failure(self, mock_message, logger_stub):
         """Test handling failure when sending error message (covers lines 76-77)"""
-        from utils.error_handler import _send_error_message
+        mock_message.answer = _failing("Failed to send")
 
-        mock_message = Mock(spec=Message)
-        mock_message.answer = AsyncMock(side_effect=Exception("Failed to send"))
+        await _send_error_message((mock_message,), "Test error")
 
-        with patch("utils.error_handler.logger") as mock_logger:
-            mock_logger.error = Mock()
-
-            await _send_error_message((mock_message,), "Test error")
-
-            # Should log the error but not crash
-            mock_logger.error.assert_called_once_with(
-                "Failed to send error message: Failed to send"
-            )
-
-    @pytest.mark.asyncio
-    async def test_handle_callback_errors_deadline_bot_error(self):
-        """Test handling DeadlineBotError in callback (covers lines 104-106)"""
-        from exceptions import DeadlineBotError
-
-        @handle_callback_errors("Custom error")
-        async def test_callback(callback):
-            raise DeadlineBotError("Deadline specific error")
-
-        mock_callback = Mock(spec=CallbackQuery)
-        mock_callback.answer = AsyncMock()
-
-        result = await test_callback(mock_callback)
+        # Should log the error but not crash
+        logger_stub.error.assert_called_once_with(
+            "Failed to send error message: Failed to send"
+        )
 
-        assert result is None
-        mock_callback.answer.assert_called_once_with("Custom error", show_alert=False)
+    @pytest.mark.parametrize(
+        "raw,expected",
+        [
+            ("", "Unknown error"),
+            ("Title cannot be empty", "Title cannot be empty"),
+            ("user 12345678901 failed", "user [ID] failed"),
+            ("token='abc-123' rejected", "token=[REDACTED]' rejected"),
+            ('password = "hunter2"', 'password=[REDACTED]"'),
+            ("secret='s3cr3t'", "secret=[REDACTED]'"),
+            ("api_key='k3y'", "api_key=[REDACTED]'"),
+            ("open /home/user/file.txt", "open [PATH]/file.txt"),
+            ("C:\\Users\\bob\\file", "[PATH]\\file"),
+            ("x" * 250, "x" * 200 + "..."),
+        ],
+    )
+    def test_sanitize_error_message(self, raw, expected):
+        """Test ids, credentials and paths are redacted and long text truncated"""
+        assert _sanitize_error_message(raw) == expected
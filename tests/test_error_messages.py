@@ -1,13 +1,21 @@
 from datetime import datetime, timezone
 
+import pytest
+
 from exceptions import (
     CallbackDataError,
+    DeadlineCreationError,
     InvalidDeadlineError,
     InvalidTimezoneError,
+    TimezoneConversionError,
     ValidationError,
 )
 from utils.error_messages import (
+    ERROR_MESSAGES,
     EXCEPTION_FORMATTERS,
+    HELP_MESSAGES,
+    SUCCESS_MESSAGES,
+    VALIDATION_MESSAGES,
     format_callback_error,
     format_deadline_error,
     format_exception_message,
@@ -18,70 +26,152 @@ from utils.error_messages import (
     get_validation_message,
 )
 
+_EXPECTED_FORMATTERS = frozenset(
+    (
+        "InvalidDeadlineError",
+        "ValidationError",
+        "CallbackDataError",
+        "InvalidTimezoneError",
+        "InvalidDateError",
+        "DeadlineNotFoundError",
+        "DatabaseError",
+        "NotificationError",
+    )
+)
 
-class TestErrorMessages:
-    """Test error message utilities"""
+_REQUIRED_ERROR_KEYS = frozenset(
+    (
+        "general_error",
+        "validation_error",
+        "database_error",
+        "deadline_not_found",
+        "deadline_create_error",
+        "deadline_update_error",
+        "deadline_delete_error",
+        "deadline_in_past",
+        "deadline_empty_title",
+        "invalid_timezone",
+        "invalid_date",
+        "invalid_callback_data",
+        "invalid_deadline_id",
+        "notification_error",
+        "empty_input",
+        "too_long_input",
+        "invalid_number",
+        "rate_limit",
+        "unknown_command",
+        "unknown_message",
+        "file_not_found",
+        "permission_denied",
+        "network_error",
+        "timeout_error",
+    )
+)
 
-    def test_get_error_message_basic(self):
-        """Test getting basic error message"""
-        message = get_error_message("general_error")
-        assert message == "Произошла ошибка. Попробуйте позже."
-
-    def test_get_error_message_with_formatting(self):
-        """Test getting error message with formatting"""
-        message = get_error_message("too_long_input", max_length=200)
-        assert message == "Слишком длинный текст. Максимальная длина: 200 символов."
-
-    def test_get_error_message_unknown_type(self):
-        """Test getting message for unknown error type"""
-        message = get_error_message("unknown_error")
-        assert message == "Произошла ошибка. Попробуйте позже."
-
-    def test_get_success_message_basic(self):
-        """Test getting basic success message"""
-        message = get_success_message("deadline_created")
-        assert message == "✅ Дедлайн успешно создан!"
-
-    def test_get_success_message_with_formatting(self):
-        """Test getting success message with formatting"""
-        message = get_success_message("deadline_created", title="Test")
-        # Should not fail even with unused formatting
-        assert "✅ Дедлайн успешно создан!" in message
+_REQUIRED_SUCCESS_KEYS = frozenset(
+    (
+        "deadline_created",
+        "deadline_updated",
+        "deadline_deleted",
+        "timezone_updated",
+        "notifications_enabled",
+        "notifications_disabled",
+        "settings_saved",
+    )
+)
 
-    def test_get_success_message_unknown_type(self):
-        """Test getting message for unknown success type"""
-        message = get_success_message("unknown_success")
-        assert message == "Операция выполнена успешно!"
+_REQUIRED_HELP_KEYS = frozenset(
+    (
+        "no_deadlines",
+        "no_deadlines_to_edit",
+        "choose_deadline",
+        "enter_title",
+        "enter_date",
+        "enter_timezone",
+        "deadline_saved",
+    )
+)
 
-    def test_get_help_message_basic(self):
-        """Test getting basic help message"""
-        message = get_help_message("no_deadlines")
-        assert message == "У вас нет дедлайнов."
+_REQUIRED_VALIDATION_KEYS = frozenset(
+    (
+        "title_required",
+        "title_too_long",
+        "date_required",
+        "date_invalid",
+        "date_past",
+        "timezone_required",
+        "timezone_invalid",
+    )
+)
 
-    def test_get_help_message_with_formatting(self):
-        """Test getting help message with formatting"""
-        message = get_help_message("title_too_long", max_length=200)
-        assert message == "Название слишком длинное (макс. 200 символов)."
+_SYSTEM_ERROR_KEYS = frozenset(("file_not_found", "permission_denied"))
 
-    def test_get_help_message_unknown_type(self):
-        """Test getting message for unknown help type"""
-        message = get_help_message("unknown_help")
-        assert message == ""
+_ALLOWED_ASCII_MESSAGES = frozenset(
+    (
+        "Произошла ошибка. Попробуйте позже.",
+        "Ошибка базы данных. Попробуйте позже.",
+    )
+)
 
-    def test_get_validation_message_basic(self):
-        """Test getting basic validation message"""
-        message = get_validation_message("title_required")
-        assert message == "Название дедлайна обязательно."
 
-    def test_get_validation_message_with_formatting(self):
-        """Test getting validation message with formatting"""
-        message = get_validation_message("timezone_invalid", timezone="Europe/Moscow")
-        assert message == "Неверный часовой пояс. Пример: Europe/Moscow."
+class TestErrorMessages:
+    """Test error message utilities"""
 
-    def test_get_validation_message_unknown_type(self):
-        """Test getting message for unknown validation type"""
-        message = get_validation_message("unknown_validation")
-        assert message == "Ошибка валидации."
+    @pytest.mark.parametrize(
+        "getter,key,kwargs,expected",
+        [
+            (
+                get_error_message,
+                "general_error",
+                {},
+                "Произошла ошибка. Попробуйте позже.",
+            ),
+            (
+                get_error_message,
+                "too_long_input",
+                {"max_length": 200},
+                "Слишком длинный текст. Максимальная длина: 200 символов.",
+            ),
+            (
+                get_error_message,
+                "unknown_error",
+                {},
+                "Произошла ошибка. Попробуйте позже.",
+            ),
+            (get_success_message, "deadline_created", {}, "✅ Дедлайн успешно создан!"),
+            (
+                get_success_message,
+                "deadline_created",
+                {"title": "Test"},
+                "✅ Дедлайн успешно создан!",
+            ),
+            (get_success_message, "unknown_success", {}, "Операция выполнена успешно!"),
+            (get_help_message, "no_deadlines", {}, "У вас нет дедлайнов."),
+            (
+                get_help_message,
+                "title_too_long",
+                {"max_length": 200},
+                "Название слишком длинное (макс. 200 символов).",
+            ),
+            (get_help_message, "unknown_help", {}, ""),
+            (
+                get_validation_message,
+                "title_required",
+                {},
+                "Название дедлайна обязательно.",
+            ),
+            (
+                get_validation_message,
+                "timezone_invalid",
+                {"timezone": "Europe/Moscow"},
+                "Неверный часовой пояс. Пример: Europe/Moscow.",
+            ),
+            (get_validation_message, "unknown_validation", {}, "Ошибка валидации."),
+        ],
+    )
+    def test_message_getters(self, getter, key, kwargs, expected):
+        """Test message getters, including formatting and unknown keys"""
+        assert getter(key, **kwargs) == expected
 
 
 class TestErrorFormatters:
@@ -105,48 +195,29 @@ class TestErrorFormatters:
         # Should fallback to general deadline create error
         assert message == get_error_message("deadline_create_error")
 
-    def test_format_validation_error_empty(self):
-        """Test formatting validation error - empty input"""
-        error = ValidationError("Title cannot be empty")
-
-        message = format_validation_error(error)
-
-        assert message == "Поле не может быть пустым."
-
-    def test_format_validation_error_long(self):
-        """Test formatting validation error - too long"""
-        error = ValidationError("Title too long")
-
-        message = format_validation_error(error)
-
-        assert "Слишком длинный текст" in message
-        assert "200" in message
-
-    def test_format_validation_error_date(self):
-        """Test formatting validation error - date"""
-        error = ValidationError("Invalid date format")
-
-        message = format_validation_error(error)
-
-        assert message == get_error_message("invalid_date")
-
-    def test_format_validation_error_timezone(self):
-        """Test formatting validation error - timezone"""
-        error = ValidationError("Invalid timezone")
-
-        message = format_validation_error(error)
-
-        assert message == get_error_message("invalid_timezone")
-
-    def test_format_validation_error_generic(self):
-        """Test formatting validation error - generic"""
-        error = ValidationError("Some other validation error")
-
-        message = format_validation_error(error)
-
-        assert message == get_error_message(
-            "validation_error", details="Some other validation error"
-        )
+    @pytest.mark.parametrize(
+        "error_text,expected",
+        [
+            ("Title cannot be empty", "Поле не может быть пустым."),
+            (
+                "Title too long",
+                "Слишком длинный текст. Максимальная длина: 200 символов.",
+            ),
+            ("Invalid date format", get_error_message("invalid_date")),
+            ("Invalid timezone", get_error_message("invalid_timezone")),
+            (
+                "Some other validation error",
+                get_error_message(
+                    "validation_error", details="Some other validation error"
+                ),
+            ),
+        ],
+    )
+    def test_format_validation_error(self, error_text, expected):
+        """Test formatting validation errors for each routed branch"""
+        message = format_validation_error(ValidationError(error_text))
+
+        assert message == expected
 
     def test_format_callback_error(self):
         """Test formatting callback error"""
@@ -183,21 +254,22 @@ class TestErrorFormatters:
 
         assert message == get_error_message("general_error")
 
+    def test_format_exception_message_subclass_uses_base_formatter(self):
+        """Test an unmapped subclass is formatted by its nearest mapped base"""
+        # TimezoneConversionError has no entry of its own; NotificationError does
+        message = format_exception_message(TimezoneConversionError("Mars/Base"))
+
+        assert message == get_error_message("notification_error")
+
+    def test_format_exception_message_unmapped_hierarchy(self):
+        """Test an exception with no mapped class in its MRO gets the general error"""
+        message = format_exception_message(DeadlineCreationError("boom"))
+
+        assert message == get_error_message("general_error")
+
     def test_exception_formatters_coverage(self):
         """Test that all exception types have formatters"""
-        expected_formatters = {
-            "InvalidDeadlineError",
-            "ValidationError",
-            "CallbackDataError",
-            "InvalidTimezoneError",
-            "InvalidDateError",
-            "DeadlineNotFoundError",
-            "DatabaseError",
-            "NotificationError",
-        }
-
-        actual_formatters = set(EXCEPTION_FORMATTERS.keys())
-        assert actual_formatters == expected_formatters
+        assert EXCEPTION_FORMATTERS.keys() == _EXPECTED_FORMATTERS
 
     def test_each_formatter_callable(self):
         """Test that all formatters are callable"""
@@ -233,106 +305,41 @@ class TestMessageConstants:
 
     def test_error_messages_completeness(self):
         """Test that all required error messages exist"""
-        from utils.error_messages import ERROR_MESSAGES
-
-        required_keys = [
-            "general_error",
-            "validation_error",
-            "database_error",
-            "deadline_not_found",
-            "deadline_create_error",
-            "deadline_update_error",
-            "deadline_delete_error",
-            "deadline_in_past",
-            "deadline_empty_title",
-            "invalid_timezone",
-            "invalid_date",
-            "invalid_callback_data",
-            "invalid_deadline_id",
-            "notification_error",
-            "empty_input",
-            "too_long_input",
-            "invalid_number",
-            "rate_limit",
-            "unknown_command",
-            "unknown_message",
-            "file_not_found",
-            "permission_denied",
-            "network_error",
-            "timeout_error",
-        ]
-
-        for key in required_keys:
-            assert key in ERROR_MESSAGES, f"Missing error message: {key}"
-            assert isinstance(ERROR_MESSAGES[key], str), (
-                f"Error message {key} is not a string"
-            )
-            assert len(ERROR_MESSAGES[key]) > 0, f"Error message {key} is empty"
+        bad = sorted(
+            key
+            for key in _REQUIRED_ERROR_KEYS
+            if not isinstance(ERROR_MESSAGES.get(key), str) or not ERROR_MESSAGES[key]
+        )
+        assert not bad, f"Missing or empty error messages: {bad}"
 
     def test_success_messages_completeness(self):
         """Test that all required success messages exist"""
-        from utils.error_messages import SUCCESS_MESSAGES
-
-        required_keys = [
-            "deadline_created",
-            "deadline_updated",
-            "deadline_deleted",
-            "timezone_updated",
-            "notifications_enabled",
-            "notifications_disabled",
-            "settings_saved",
-        ]
-
-        for key in required_keys:
-            assert key in SUCCESS_MESSAGES, f"Missing success message: {key}"
-            assert isinstance(SUCCESS_MESSAGES[key], str), (
-                f"Success message {key} is not a string"
-            )
-            assert len(SUCCESS_MESSAGES[key]) > 0, f"Success message {key} is empty"
+        bad = sorted(
+            key
+            for key in _REQUIRED_SUCCESS_KEYS
+            if not isinstance(SUCCESS_MESSAGES.get(key), str)
+            or not SUCCESS_MESSAGES[key]
+        )
+        assert not bad, f"Missing or empty success messages: {bad}"
 
     def test_help_messages_completeness(self):
         """Test that all required help messages exist"""
-        from utils.error_messages import HELP_MESSAGES
-
-        required_keys = [
-            "no_deadlines",
-            "no_deadlines_to_edit",
-            "choose_deadline",
-            "enter_title",
-            "enter_date",
-            "enter_timezone",
-            "deadline_saved",
-        ]
-
-        for key in required_keys:
-            assert key in HELP_MESSAGES, f"Missing help message: {key}"
-            assert isinstance(HELP_MESSAGES[key], str), (
-                f"Help message {key} is not a string"
-            )
-            assert len(HELP_MESSAGES[key]) > 0, f"Help message {key} is empty"
+        bad = sorted(
+            key
+            for key in _REQUIRED_HELP_KEYS
+            if not isinstance(HELP_MESSAGES.get(key), str) or not HELP_MESSAGES[key]
+        )
+        assert not bad, f"Missing or empty help messages: {bad}"
 
     def test_validation_messages_completeness(self):
         """Test that all required validation messages exist"""
-        from utils.error_messages import VALIDATION_MESSAGES
-
-        required_keys = [
-            "title_required",
-            "title_too_long",
-            "date_required",
-            "date_invalid",
-            "date_past",
-            "timezone_required",
-            "timezone_invalid",
-        ]
-
-        for key in required_keys:
-            assert key in VALIDATION_MESSAGES, f"Missing validation message: {key}"
-            assert isinstance(VALIDATION_MESSAGES[key], str), (
-                f"Validation message {key} is not a string"
-            )
-            assert len(VALIDATION_MESSAGES[key]) > 0, (
-                f"Validation message {key} is empty"
-            )
+        bad = sorted(
+            key
+            for key in _REQUIRED_VALIDATION_KEYS
+            if not isinstance(VALIDATION_MESSAGES.get(key), str)
+            or not VALIDATION_MESSAGES[key]
+        )
+        assert not bad, f"Missing or empty validation messages: {bad}"
 
 
 class TestMessageFormatting:
@@ -361,12 +368,9 @@ class TestMessageFormatting:
 
     def test_russian_language_messages(self):
         """Test that messages are in Russian"""
-        from utils.error_messages import ERROR_MESSAGES
-
         for key, message in ERROR_MESSAGES.items():
             # Check that messages contain Cyrillic characters for user-facing errors
-            if key not in ["file_not_found", "permission_denied"]:  # System errors
-                assert any(ord(char) > 127 for char in message) or message in [
-                    "Произошла ошибка. Попробуйте позже.",
-                    "Ошибка базы данных. Попробуйте позже.",
-                ], f"Message {key} might not be in Russian: {message}"
+            if key not in _SYSTEM_ERROR_KEYS:
+                assert not message.isascii() or message in _ALLOWED_ASCII_MESSAGES, (
+                    f"Message {key} might not be in Russian: {message}"
+                )
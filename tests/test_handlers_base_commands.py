@@ -1,14 +1,9 @@
-from datetime import datetime, timedelta, timezone
-from unittest.mock import AsyncMock, Mock, patch
+from datetime import datetime, timezone
+from functools import lru_cache
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
 
 import pytest
-from aiogram.fsm.context import FSMContext
-from aiogram.types import (
-    InlineKeyboardButton,
-    InlineKeyboardMarkup,
-    Message,
-)
-from aiogram.types import User as TelegramUser
 
 from handlers.base_handlers import (
     add_datetime,
@@ -21,253 +16,194 @@ from handlers.base_handlers import (
 from handlers.fsm_add_deadline import AddDeadlineFSM
 
 
+@lru_cache(maxsize=None)
+def _expected_delete_markup():
+    """Keyboard delete_deadline_command builds for the single "Test Deadline" (id=1)"""
+    from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
+
+    return InlineKeyboardMarkup(
+        inline_keyboard=[
+            [InlineKeyboardButton(text="❌ 1. Test Deadline", callback_data="delete:1")]
+        ]
+    )
+
+
+@pytest.fixture
+def plain_message():
+    """Plain message stand-in; base handlers only read text/from_user and answer"""
+    return SimpleNamespace(
+        answer=AsyncMock(), from_user=SimpleNamespace(id=12345), text=""
+    )
+
+
 class TestBaseHandlers:
     """Test cases for base handlers"""
 
-    @pytest.mark.asyncio
-    async def test_add_start_command(self):
+    async def test_add_start_command(self, plain_message, fsm_state):
         """Test add command starts FSM"""
-        mock_message = Mock(spec=Message)
-        mock_message.answer = AsyncMock()
-        mock_state = Mock(spec=FSMContext)
-        mock_state.set_state = AsyncMock()
-
-        await add_start(mock_message, mock_state)
+        await add_start(plain_message, fsm_state)
 
-        mock_message.answer.assert_called_once_with("Enter the title of the deadline:")
-        mock_state.set_state.assert_called_once_with(AddDeadlineFSM.title)
+        plain_message.answer.assert_called_once_with("Enter the title of the deadline:")
+        fsm_state.set_state.assert_called_once_with(AddDeadlineFSM.title)
 
-    @pytest.mark.asyncio
-    async def test_list_deadlines_with_deadlines(self):
+    async def test_list_deadlines_with_deadlines(
+        self, plain_message, make_service, future_date
+    ):
         """Test list command with existing deadlines"""
-        mock_user = Mock(spec=TelegramUser)
-        mock_user.id = 12345
-        mock_message = Mock(spec=Message)
-        mock_message.answer = AsyncMock()
-        mock_message.from_user = mock_user
-
-        mock_deadline_service = AsyncMock()
-        mock_deadline_service.get_timezone_for_user.return_value = "UTC"
-
-        future_date = datetime.now(timezone.utc) + timedelta(days=7)
-        mock_deadline = Mock()
-        mock_deadline.title = "Test Deadline"
-        mock_deadline.deadline_at = future_date
-        mock_deadline_service.list_for_user.return_value = [mock_deadline]
+        mock_deadline = SimpleNamespace(title="Test Deadline", deadline_at=future_date)
+        mock_deadline_service = make_service(
+            get_timezone_for_user="UTC", list_for_user=[mock_deadline]
+        )
 
-        await list_deadlines(mock_message, mock_deadline_service)
+        await list_deadlines(plain_message, mock_deadline_service)
 
         mock_deadline_service.get_timezone_for_user.assert_called_once_with(12345)
         mock_deadline_service.list_for_user.assert_called_once_with(12345)
-        mock_message.answer.assert_called_once()
-        call_args = mock_message.answer.call_args[0][0]
-        assert "Твои дедлайны:" in call_args
-        assert "Test Deadline" in call_args
+        plain_message.answer.assert_called_once_with(
+            "Твои дедлайны:\n \n*1.* Не горит *Test Deadline* \n08.01.2025 00:00",
+            parse_mode="Markdown",
+        )
 
-    @pytest.mark.asyncio
-    async def test_list_deadlines_no_deadlines(self):
+    async def test_list_deadlines_no_deadlines(self, plain_message, make_service):
         """Test list command with no deadlines"""
-        mock_user = Mock(spec=TelegramUser)
-        mock_user.id = 12345
-        mock_message = Mock(spec=Message)
-        mock_message.answer = AsyncMock()
-        mock_message.from_user = mock_user
-
-        mock_deadline_service = AsyncMock()
-        mock_deadline_service.get_timezone_for_user.return_value = "UTC"
-        mock_deadline_service.list_for_user.return_value = []
+        mock_deadline_service = make_service(
+            get_timezone_for_user="UTC", list_for_user=[]
+        )
 
-        await list_deadlines(mock_message, mock_deadline_service)
+        await list_deadlines(plain_message, mock_deadline_service)
 
         mock_deadline_service.get_timezone_for_user.assert_called_once_with(12345)
         mock_deadline_service.list_for_user.assert_called_once_with(12345)
-        mock_message.answer.assert_called_once_with(
+        plain_message.answer.assert_called_once_with(
             "Нет дедлайнов!", parse_mode="Markdown"
         )
 
-    @pytest.mark.asyncio
-    async def test_change_timezone_success(self):
-        """Test successful timezone change"""
-        mock_user = Mock(spec=TelegramUser)
-        mock_user.id = 12345
-        mock_message = Mock(spec=Message)
-        mock_message.text = "/change_timezone Europe/Moscow"
-        mock_message.answer = AsyncMock()
-        mock_message.from_user = mock_user
-
-        mock_deadline_service = AsyncMock()
-        mock_deadline_service.edit_timezone.return_value = True
-
-        await change_timezone_command(mock_message, mock_deadline_service)
-
-        mock_deadline_service.edit_timezone.assert_called_once_with(
-            12345, "Europe/Moscow"
-        )
-        mock_message.answer.assert_called_once_with(
-            "Временная зона успешно изменена!", parse_mode="Markdown"
+    @pytest.mark.parametrize(
+        "text,edit_result,expected_answer,expected_timezone",
+        [
+            (
+                "/change_timezone Europe/Moscow",
+                True,
+                "Временная зона успешно изменена!",
+                "Europe/Moscow",
+            ),
+            ("/change_timezone", None, "Неверный формат команды!", None),
+            (
+                "/change_timezone Invalid/Zone",
+                False,
+                "Неверная временная зона!",
+                "Invalid/Zone",
+            ),
+        ],
+    )
+    async def test_change_timezone(
+        self,
+        plain_message,
+        make_service,
+        text,
+        edit_result,
+        expected_answer,
+        expected_timezone,
+    ):
+        """Test timezone change success, bad command format and rejected zone"""
+        plain_message.text = text
+
+        mock_deadline_service = make_service(edit_timezone=edit_result)
+
+        await change_timezone_command(plain_message, mock_deadline_service)
+
+        if expected_timezone is None:
+            mock_deadline_service.edit_timezone.assert_not_called()
+        else:
+            mock_deadline_service.edit_timezone.assert_called_once_with(
+                12345, expected_timezone
+            )
+        plain_message.answer.assert_called_once_with(
+            expected_answer, parse_mode="Markdown"
         )
 
-    @pytest.mark.asyncio
-    async def test_change_timezone_invalid_format(self):
-        """Test timezone change with invalid format"""
-        mock_user = Mock(spec=TelegramUser)
-        mock_user.id = 12345
-        mock_message = Mock(spec=Message)
-        mock_message.text = "/change_timezone"
-        mock_message.answer = AsyncMock()
-        mock_message.from_user = mock_user
-
-        mock_deadline_service = AsyncMock()
-
-        await change_timezone_command(mock_message, mock_deadline_service)
-
-        mock_deadline_service.edit_timezone.assert_not_called()
-        mock_message.answer.assert_called_once_with(
-            "Неверный формат команды!", parse_mode="Markdown"
-        )
-
-    @pytest.mark.asyncio
-    async def test_change_timezone_failure(self):
-        """Test timezone change failure"""
-        mock_user = Mock(spec=TelegramUser)
-        mock_user.id = 12345
-        mock_message = Mock(spec=Message)
-        mock_message.text = "/change_timezone Invalid/Zone"
-        mock_message.answer = AsyncMock()
-        mock_message.from_user = mock_user
-
-        mock_deadline_service = AsyncMock()
-        mock_deadline_service.edit_timezone.return_value = False
-
-        await change_timezone_command(mock_message, mock_deadline_service)
-
-        mock_deadline_service.edit_timezone.assert_called_once_with(
-            12345, "Invalid/Zone"
-        )
-        mock_message.answer.assert_called_once_with(
-            "Неверная временная зона!", parse_mode="Markdown"
-        )
-
-    @pytest.mark.asyncio
-    async def test_delete_deadline_command_with_deadlines(self):
+    async def test_delete_deadline_command_with_deadlines(
+        self, plain_message, make_service, future_date
+    ):
         """Test delete command with existing deadlines"""
-        mock_user = Mock(spec=TelegramUser)
-        mock_user.id = 12345
-        mock_message = Mock(spec=Message)
-        mock_message.answer = AsyncMock()
-        mock_message.from_user = mock_user
-
-        mock_deadline_service = AsyncMock()
-        mock_deadline = Mock()
-        mock_deadline.id = 1
-        mock_deadline.title = "Test Deadline"
-        mock_deadline.deadline_at = datetime.now(timezone.utc) + timedelta(days=7)
-        mock_deadline_service.list_for_user.return_value = [mock_deadline]
+        mock_deadline = SimpleNamespace(
+            id=1, title="Test Deadline", deadline_at=future_date
+        )
+        mock_deadline_service = make_service(list_for_user=[mock_deadline])
 
-        await delete_deadline_command(mock_message, mock_deadline_service)
+        await delete_deadline_command(plain_message, mock_deadline_service)
 
         mock_deadline_service.list_for_user.assert_called_once_with(12345)
-        mock_message.answer.assert_called_once()
-        call_args = mock_message.answer.call_args
-        assert call_args[0][0] == "\n".join(
-            [
-                "Выбери дедлайн для удаления:",
-                " ",
-                "1. ⏰ Test Deadline - " + str(mock_deadline.deadline_at),
-            ]
+        plain_message.answer.assert_called_once_with(
+            "Выбери дедлайн для удаления:\n \n1. ⏰ Test Deadline - "
+            f"{future_date}",
+            reply_markup=_expected_delete_markup(),
+            parse_mode="Markdown",
         )
-        assert call_args[1]["reply_markup"] is not None
-        assert call_args[1]["parse_mode"] == "Markdown"
 
-    @pytest.mark.asyncio
-    async def test_delete_deadline_command_no_deadlines(self):
+    async def test_delete_deadline_command_no_deadlines(
+        self, plain_message, make_service
+    ):
         """Test delete command with no deadlines"""
-        mock_user = Mock(spec=TelegramUser)
-        mock_user.id = 12345
-        mock_message = Mock(spec=Message)
-        mock_message.answer = AsyncMock()
-        mock_message.from_user = mock_user
-
-        mock_deadline_service = AsyncMock()
-        mock_deadline_service.list_for_user.return_value = []
+        mock_deadline_service = make_service(list_for_user=[])
 
-        await delete_deadline_command(mock_message, mock_deadline_service)
+        await delete_deadline_command(plain_message, mock_deadline_service)
 
         mock_deadline_service.list_for_user.assert_called_once_with(12345)
-        mock_message.answer.assert_called_once_with(
+        plain_message.answer.assert_called_once_with(
             "Нет дедлайнов для удаления!", parse_mode="Markdown"
         )
 
-    @pytest.mark.asyncio
-    async def test_add_title_handler(self):
+    async def test_add_title_handler(self, plain_message, fsm_state):
         """Test adding title in FSM"""
-        mock_message = Mock(spec=Message)
-        mock_message.text = "Test Title"
-        mock_message.answer = AsyncMock()
-        mock_state = Mock(spec=FSMContext)
-        mock_state.update_data = AsyncMock()
-        mock_state.set_state = AsyncMock()
+        plain_message.text = "Test Title"
 
-        await add_title(mock_message, mock_state)
+        await add_title(plain_message, fsm_state)
 
-        mock_state.update_data.assert_called_once_with(title="Test Title")
-        mock_message.answer.assert_called_once_with(
+        fsm_state.update_data.assert_called_once_with(title="Test Title")
+        plain_message.answer.assert_called_once_with(
             "Введи дату в формате ДД.ММ.ГГГГ ЧЧ:ММ", parse_mode="Markdown"
         )
-        mock_state.set_state.assert_called_once_with(AddDeadlineFSM.datetime)
+        fsm_state.set_state.assert_called_once_with(AddDeadlineFSM.datetime)
 
-    @pytest.mark.asyncio
-    async def test_add_datetime_success(self):
+    async def test_add_datetime_success(
+        self, plain_message, make_service, mock_dateparser, fsm_state
+    ):
         """Test successful datetime addition in FSM"""
-        mock_user = Mock(spec=TelegramUser)
-        mock_user.id = 12345
-        mock_message = Mock(spec=Message)
-        mock_message.text = "25.12.2025 15:00"
-        mock_message.answer = AsyncMock()
-        mock_message.from_user = mock_user
+        plain_message.text = "25.12.2025 15:00"
 
-        mock_state = Mock(spec=FSMContext)
-        mock_state.get_data = AsyncMock(return_value={"title": "Test Title"})
-        mock_state.clear = AsyncMock()
+        fsm_state.get_data.return_value = {"title": "Test Title"}
 
-        mock_deadline_service = AsyncMock()
-        mock_deadline_service.create = AsyncMock()
+        mock_deadline_service = make_service(create=None)
 
-        with patch("handlers.base_handlers.dateparser.parse") as mock_parse:
-            parsed_date = datetime(2025, 12, 25, 15, 0, tzinfo=timezone.utc)
-            mock_parse.return_value = parsed_date
+        parsed_date = datetime(2025, 12, 25, 15, 0, tzinfo=timezone.utc)
+        mock_dateparser.return_value = parsed_date
 
-            await add_datetime(mock_message, mock_state, mock_deadline_service)
+        await add_datetime(plain_message, fsm_state, mock_deadline_service)
 
         mock_deadline_service.create.assert_called_once_with(
             user_id=12345, title="Test Title", dt=parsed_date
         )
-        mock_message.answer.assert_called_once()
-        assert "Дедлайн успешно добавлен!" in mock_message.answer.call_args[0][0]
-        mock_state.clear.assert_called_once()
+        plain_message.answer.assert_called_once_with(
+            f"Дедлайн успешно добавлен! Сработает в {parsed_date}",
+            parse_mode="Markdown",
+        )
+        fsm_state.clear.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_add_datetime_invalid_date(self):
+    async def test_add_datetime_invalid_date(
+        self, plain_message, make_service, mock_dateparser, fsm_state
+    ):
         """Test invalid date in datetime handler"""
-        mock_user = Mock(spec=TelegramUser)
-        mock_user.id = 12345
-        mock_message = Mock(spec=Message)
-        mock_message.text = "invalid date"
-        mock_message.answer = AsyncMock()
-        mock_message.from_user = mock_user
-
-        mock_state = Mock(spec=FSMContext)
-        mock_state.clear = AsyncMock()
+        plain_message.text = "invalid date"
 
-        mock_deadline_service = AsyncMock()
+        mock_deadline_service = make_service()
 
-        with patch("handlers.base_handlers.dateparser.parse") as mock_parse:
-            mock_parse.return_value = None
+        mock_dateparser.return_value = None
 
-            await add_datetime(mock_message, mock_state, mock_deadline_service)
+        await add_datetime(plain_message, fsm_state, mock_deadline_service)
 
         mock_deadline_service.create.assert_not_called()
-        mock_message.answer.assert_called_once_with(
+        plain_message.answer.assert_called_once_with(
             "Не понял дату(", parse_mode="Markdown"
         )
-        mock_state.clear.assert_not_called()
+        fsm_state.clear.assert_not_called()
@@ -1,15 +1,10 @@
 from datetime import datetime, timezone
-from unittest.mock import AsyncMock, Mock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 from aiogram.fsm.context import FSMContext
-from aiogram.types import (
-    CallbackQuery,
-    InaccessibleMessage,
-    InlineKeyboardButton,
-    InlineKeyboardMarkup,
-    Message,
-)
+from aiogram.types import InaccessibleMessage
 
 from handlers.edit_deadline import (
     choose_edit_field,
@@ -21,23 +16,25 @@ from handlers.edit_deadline import (
 from handlers.fsm_edit_deadline import EditDeadlineFSM
 
 
+def _editable_message():
+    message = Mock()
+    message.edit_text = AsyncMock()
+    return message
+
+
 class TestEditDeadlineHandlers:
     """Test cases for edit deadline handlers"""
 
-    @pytest.mark.asyncio
-    async def test_edit_deadline_command_with_deadlines(self):
+    async def test_edit_deadline_command_with_deadlines(
+        self, mock_message, make_service, frozen_now
+    ):
         """Test edit command with existing deadlines"""
-        mock_message = Mock(spec=Message)
-        mock_message.answer = AsyncMock()
-        mock_message.from_user = Mock()
-        mock_message.from_user.id = 12345
-
-        mock_deadline_service = AsyncMock()
-        mock_deadline = Mock()
-        mock_deadline.id = 1
-        mock_deadline.title = "Test Deadline"
-        mock_deadline.deadline_at = datetime.now(timezone.utc)
-        mock_deadline_service.list_for_user.return_value = [mock_deadline]
+        mock_message.from_user = SimpleNamespace(id=12345)
+
+        mock_deadline = SimpleNamespace(
+            id=1, title="Test Deadline", deadline_at=frozen_now
+        )
+        mock_deadline_service = make_service(list_for_user=[mock_deadline])
 
         await edit_deadline_command(mock_message, mock_deadline_service)
 
@@ -47,16 +44,11 @@ class TestEditDeadlineHandlers:
         assert "Выбери дедлайн для редактирования:" in call_args[0][0]
         assert call_args[1]["reply_markup"] is not None
 
-    @pytest.mark.asyncio
-    async def test_edit_deadline_command_no_deadlines(self):
+    async def test_edit_deadline_command_no_deadlines(self, mock_message, make_service):
         """Test edit command with no deadlines"""
-        mock_message = Mock(spec=Message)
-        mock_message.answer = AsyncMock()
-        mock_message.from_user = Mock()
-        mock_message.from_user.id = 12345
+        mock_message.from_user = SimpleNamespace(id=12345)
 
-        mock_deadline_service = AsyncMock()
-        mock_deadline_service.list_for_user.return_value = []
+        mock_deadline_service = make_service(list_for_user=[])
 
         await edit_deadline_command(mock_message, mock_deadline_service)
 
@@ -65,44 +57,41 @@ class TestEditDeadlineHandlers:
             "У вас нет дедлайнов для редактирования!"
         )
 
-    @pytest.mark.asyncio
-    async def test_choose_edit_field_success(self):
-        """Test choosing edit field successfully"""
-        mock_callback = Mock(spec=CallbackQuery)
+    @pytest.mark.parametrize(
+        "make_message",
+        [
+            pytest.param(_editable_message, id="editable"),
+            pytest.param(InaccessibleMessage.model_construct, id="inaccessible"),
+        ],
+    )
+    async def test_choose_edit_field_success(
+        self, mock_callback, make_service, fsm_state, frozen_now, make_message
+    ):
+        """Test choosing edit field; only a reachable message gets edited"""
         mock_callback.data = "edit:123"
-        mock_callback.from_user = Mock()
-        mock_callback.from_user.id = 456
-        mock_callback.answer = AsyncMock()
-        mock_callback.message = Mock()
-        mock_callback.message.edit_text = AsyncMock()
+        mock_callback.from_user = SimpleNamespace(id=456)
+        mock_callback.message = make_message()
 
-        mock_state = Mock(spec=FSMContext)
-        mock_state.update_data = AsyncMock()
-        mock_state.set_state = AsyncMock()
+        mock_deadline = SimpleNamespace(title="Test Deadline", deadline_at=frozen_now)
+        mock_deadline_service = make_service(get_by_id=mock_deadline)
 
-        mock_deadline_service = AsyncMock()
-        mock_deadline = Mock()
-        mock_deadline.title = "Test Deadline"
-        mock_deadline.deadline_at = datetime.now(timezone.utc)
-        mock_deadline_service.get_by_id.return_value = mock_deadline
-
-        await choose_edit_field(mock_callback, mock_state, mock_deadline_service)
+        await choose_edit_field(mock_callback, fsm_state, mock_deadline_service)
 
         mock_deadline_service.get_by_id.assert_called_once_with(123, 456)
-        mock_state.update_data.assert_called_once_with(deadline_id=123)
-        mock_callback.message.edit_text.assert_called_once()
-        mock_state.set_state.assert_called_once_with(EditDeadlineFSM.choose_field)
+        fsm_state.update_data.assert_called_once_with(deadline_id=123)
+        if make_message is _editable_message:
+            mock_callback.message.edit_text.assert_called_once()
+        fsm_state.set_state.assert_called_once_with(EditDeadlineFSM.choose_field)
         mock_callback.answer.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_choose_edit_field_invalid_callback_data(self):
+    async def test_choose_edit_field_invalid_callback_data(
+        self, mock_callback, make_service
+    ):
         """Test choosing edit field with invalid callback data"""
-        mock_callback = Mock(spec=CallbackQuery)
         mock_callback.data = "invalid"
-        mock_callback.answer = AsyncMock(show_alert=True)
 
         mock_state = Mock(spec=FSMContext)
-        mock_deadline_service = AsyncMock()
+        mock_deadline_service = make_service()
 
         await choose_edit_field(mock_callback, mock_state, mock_deadline_service)
 
@@ -111,18 +100,15 @@ class TestEditDeadlineHandlers:
             "Invalid deadline ID", show_alert=True
         )
 
-    @pytest.mark.asyncio
-    async def test_choose_edit_field_deadline_not_found(self):
+    async def test_choose_edit_field_deadline_not_found(
+        self, mock_callback, make_service
+    ):
         """Test choosing edit field when deadline not found"""
-        mock_callback = Mock(spec=CallbackQuery)
         mock_callback.data = "edit:123"
-        mock_callback.from_user = Mock()
-        mock_callback.from_user.id = 456
-        mock_callback.answer = AsyncMock(show_alert=True)
+        mock_callback.from_user = SimpleNamespace(id=456)
 
         mock_state = Mock(spec=FSMContext)
-        mock_deadline_service = AsyncMock()
-        mock_deadline_service.get_by_id.return_value = None
+        mock_deadline_service = make_service(get_by_id=None)
 
         await choose_edit_field(mock_callback, mock_state, mock_deadline_service)
 
@@ -131,39 +117,9 @@ class TestEditDeadlineHandlers:
             "Deadline not found", show_alert=True
         )
 
-    @pytest.mark.asyncio
-    async def test_choose_edit_field_inaccessible_message(self):
-        """Test choosing edit field with inaccessible message"""
-        mock_callback = Mock(spec=CallbackQuery)
-        mock_callback.data = "edit:123"
-        mock_callback.from_user = Mock()
-        mock_callback.from_user.id = 456
-        mock_callback.answer = AsyncMock()
-        mock_callback.message = Mock(spec=InaccessibleMessage)
-
-        mock_state = Mock(spec=FSMContext)
-        mock_state.update_data = AsyncMock()
-        mock_state.set_state = AsyncMock()
-
-        mock_deadline_service = AsyncMock()
-        mock_deadline = Mock()
-        mock_deadline.title = "Test Deadline"
-        mock_deadline.deadline_at = datetime.now(timezone.utc)
-        mock_deadline_service.get_by_id.return_value = mock_deadline
-
-        await choose_edit_field(mock_callback, mock_state, mock_deadline_service)
-
-        mock_deadline_service.get_by_id.assert_called_once_with(123, 456)
-        mock_state.update_data.assert_called_once_with(deadline_id=123)
-        mock_state.set_state.assert_called_once_with(EditDeadlineFSM.choose_field)
-        mock_callback.answer.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_process_field_choice_cancel(self):
+    async def test_process_field_choice_cancel(self, mock_callback):
         """Test canceling field choice"""
-        mock_callback = Mock(spec=CallbackQuery)
         mock_callback.data = "edit_field:cancel"
-        mock_callback.answer = AsyncMock()
         mock_callback.message = Mock()
         mock_callback.message.edit_text = AsyncMock()
 
@@ -178,12 +134,9 @@ class TestEditDeadlineHandlers:
         )
         mock_callback.answer.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_process_field_choice_title(self):
+    async def test_process_field_choice_title(self, mock_callback):
         """Test choosing to edit title"""
-        mock_callback = Mock(spec=CallbackQuery)
         mock_callback.data = "edit_field:title"
-        mock_callback.answer = AsyncMock()
         mock_callback.message = Mock()
         mock_callback.message.edit_text = AsyncMock()
 
@@ -198,12 +151,9 @@ class TestEditDeadlineHandlers:
         mock_state.set_state.assert_called_once_with(EditDeadlineFSM.edit_title)
         mock_callback.answer.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_process_field_choice_datetime(self):
+    async def test_process_field_choice_datetime(self, mock_callback):
         """Test choosing to edit datetime"""
-        mock_callback = Mock(spec=CallbackQuery)
         mock_callback.data = "edit_field:datetime"
-        mock_callback.answer = AsyncMock()
         mock_callback.message = Mock()
         mock_callback.message.edit_text = AsyncMock()
 
@@ -218,93 +168,69 @@ class TestEditDeadlineHandlers:
         mock_state.set_state.assert_called_once_with(EditDeadlineFSM.edit_datetime)
         mock_callback.answer.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_process_new_title_success(self):
-        """Test processing new title successfully"""
-        mock_message = Mock(spec=Message)
-        mock_message.text = "New Title"
-        mock_message.answer = AsyncMock()
-
-        mock_state = Mock(spec=FSMContext)
-        mock_state.get_data = AsyncMock(return_value={"deadline_id": 123})
-        mock_state.clear = AsyncMock()
-
-        mock_deadline_service = AsyncMock()
-        mock_deadline_service.update.return_value = True
-
-        await process_new_title(mock_message, mock_state, mock_deadline_service)
-
-        mock_state.get_data.assert_called_once()
-        mock_deadline_service.update.assert_called_once_with(123, title="New Title")
-        mock_message.answer.assert_called_once_with(
-            "Название успешно изменено на: *New Title*", parse_mode="Markdown"
-        )
-        mock_state.clear.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_process_new_title_no_deadline_id(self):
-        """Test processing new title with no deadline ID"""
-        mock_message = Mock(spec=Message)
-        mock_message.text = "New Title"
-        mock_message.answer = AsyncMock()
-
-        mock_state = Mock(spec=FSMContext)
-        mock_state.get_data = AsyncMock(return_value={})
-        mock_state.clear = AsyncMock()
-
-        mock_deadline_service = AsyncMock()
-
-        await process_new_title(mock_message, mock_state, mock_deadline_service)
-
-        mock_deadline_service.update.assert_not_called()
-        mock_message.answer.assert_called_once_with(
-            "Ошибка: дедлайн не найден", parse_mode="Markdown"
-        )
-        mock_state.clear.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_process_new_title_update_failure(self):
-        """Test processing new title with update failure"""
-        mock_message = Mock(spec=Message)
+    @pytest.mark.parametrize(
+        "state_data,update_result,expected_answer",
+        [
+            pytest.param(
+                {"deadline_id": 123},
+                True,
+                "Название успешно изменено на: *New Title*",
+                id="success",
+            ),
+            pytest.param({}, None, "Ошибка: дедлайн не найден", id="no_deadline_id"),
+            pytest.param(
+                {"deadline_id": 123},
+                False,
+                "Не удалось обновить дедлайн",
+                id="update_failure",
+            ),
+        ],
+    )
+    async def test_process_new_title(
+        self,
+        mock_message,
+        make_service,
+        fsm_state,
+        state_data,
+        update_result,
+        expected_answer,
+    ):
+        """Test new title is saved, or the right error is reported"""
         mock_message.text = "New Title"
-        mock_message.answer = AsyncMock()
-
-        mock_state = Mock(spec=FSMContext)
-        mock_state.get_data = AsyncMock(return_value={"deadline_id": 123})
-        mock_state.clear = AsyncMock()
+        fsm_state.get_data.return_value = state_data
 
-        mock_deadline_service = AsyncMock()
-        mock_deadline_service.update.return_value = False
+        mock_deadline_service = make_service(update=update_result)
 
-        await process_new_title(mock_message, mock_state, mock_deadline_service)
+        await process_new_title(mock_message, fsm_state, mock_deadline_service)
 
-        mock_deadline_service.update.assert_called_once_with(123, title="New Title")
+        if "deadline_id" in state_data:
+            mock_deadline_service.update.assert_called_once_with(
+                123, title="New Title"
+            )
+        else:
+            mock_deadline_service.update.assert_not_called()
         mock_message.answer.assert_called_once_with(
-            "Не удалось обновить дедлайн", parse_mode="Markdown"
+            expected_answer, parse_mode="Markdown"
         )
-        mock_state.clear.assert_called_once()
+        fsm_state.clear.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_process_new_datetime_success(self):
+    async def test_process_new_datetime_success(
+        self, mock_message, mock_dateparser, make_service
+    ):
         """Test processing new datetime successfully"""
-        mock_message = Mock(spec=Message)
         mock_message.text = "25.12.2025 15:00"
-        mock_message.answer = AsyncMock()
-        mock_message.from_user = Mock()
-        mock_message.from_user.id = 456
+        mock_message.from_user = SimpleNamespace(id=456)
 
         mock_state = Mock(spec=FSMContext)
         mock_state.get_data = AsyncMock(return_value={"deadline_id": 123})
         mock_state.clear = AsyncMock()
 
-        mock_deadline_service = AsyncMock()
-        mock_deadline_service.update.return_value = True
+        mock_deadline_service = make_service(update=True)
 
-        with patch("handlers.edit_deadline.dateparser.parse") as mock_parse:
-            parsed_date = datetime(2025, 12, 25, 15, 0)
-            mock_parse.return_value = parsed_date
+        parsed_date = datetime(2025, 12, 25, 15, 0)
+        mock_dateparser.return_value = parsed_date
 
-            await process_new_datetime(mock_message, mock_state, mock_deadline_service)
+        await process_new_datetime(mock_message, mock_state, mock_deadline_service)
 
         expected_dt = parsed_date.replace(tzinfo=timezone.utc)
         mock_deadline_service.update.assert_called_once_with(123, dt=expected_dt)
@@ -312,25 +238,22 @@ class TestEditDeadlineHandlers:
         assert "Дата успешно изменена на" in mock_message.answer.call_args[0][0]
         mock_state.clear.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_process_new_datetime_invalid_date(self):
+    async def test_process_new_datetime_invalid_date(
+        self, mock_message, mock_dateparser, make_service
+    ):
         """Test processing new datetime with invalid date"""
-        mock_message = Mock(spec=Message)
         mock_message.text = "invalid date"
-        mock_message.answer = AsyncMock()
-        mock_message.from_user = Mock()
-        mock_message.from_user.id = 456
+        mock_message.from_user = SimpleNamespace(id=456)
 
         mock_state = Mock(spec=FSMContext)
         mock_state.get_data = AsyncMock(return_value={"deadline_id": 123})
         mock_state.clear = AsyncMock()
 
-        mock_deadline_service = AsyncMock()
+        mock_deadline_service = make_service()
 
-        with patch("handlers.edit_deadline.dateparser.parse") as mock_parse:
-            mock_parse.return_value = None
+        mock_dateparser.return_value = None
 
-            await process_new_datetime(mock_message, mock_state, mock_deadline_service)
+        await process_new_datetime(mock_message, mock_state, mock_deadline_service)
 
         mock_deadline_service.update.assert_not_called()
         mock_message.answer.assert_called_once_with(
@@ -338,20 +261,20 @@ class TestEditDeadlineHandlers:
         )
         mock_state.clear.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_process_new_datetime_no_deadline_id(self):
+    async def test_process_new_datetime_no_deadline_id(
+        self, mock_message, mock_dateparser, make_service
+    ):
         """Test processing new datetime with no deadline ID"""
-        mock_message = Mock(spec=Message)
         mock_message.text = "25.12.2025 15:00"
-        mock_message.answer = AsyncMock()
-        mock_message.from_user = Mock()
-        mock_message.from_user.id = 456
+        mock_message.from_user = SimpleNamespace(id=456)
 
         mock_state = Mock(spec=FSMContext)
         mock_state.get_data = AsyncMock(return_value={})
         mock_state.clear = AsyncMock()
 
-        mock_deadline_service = AsyncMock()
+        mock_deadline_service = make_service()
+
+        mock_dateparser.return_value = datetime(2025, 12, 25, 15, 0)
 
         await process_new_datetime(mock_message, mock_state, mock_deadline_service)
 
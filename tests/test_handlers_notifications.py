@@ -1,44 +1,35 @@
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, Mock
 
 import pytest
-from aiogram.types import (
-    CallbackQuery,
-    InaccessibleMessage,
-    InlineKeyboardButton,
-    InlineKeyboardMarkup,
-    Message,
-)
+from aiogram.types import InaccessibleMessage
 
 from handlers.notifications import (
     notifications_command,
     toggle_notification,
 )
 
+# Mirrors the NotificationSettings toggles; conftest can't be imported from here
+_NOTIFICATION_FIELDS = (
+    "notify_on_due",
+    "notify_1_hour",
+    "notify_3_hours",
+    "notify_1_day",
+    "notify_3_days",
+    "notify_1_week",
+)
+
 
 class TestNotificationsHandlers:
     """Test cases for notifications handlers"""
 
-    @pytest.mark.asyncio
-    async def test_notifications_command(self):
+    async def test_notifications_command(self, mock_message, notification_service):
         """Test notifications command with all settings enabled"""
-        mock_message = Mock(spec=Message)
-        mock_message.answer = AsyncMock()
-        mock_message.from_user = Mock()
-        mock_message.from_user.id = 12345
-
-        mock_notification_service = AsyncMock()
-        mock_settings = Mock()
-        mock_settings.notify_on_due = True
-        mock_settings.notify_1_hour = True
-        mock_settings.notify_3_hours = True
-        mock_settings.notify_1_day = True
-        mock_settings.notify_3_days = True
-        mock_settings.notify_1_week = True
-        mock_notification_service.get_or_create_settings.return_value = mock_settings
-
-        await notifications_command(mock_message, mock_notification_service)
-
-        mock_notification_service.get_or_create_settings.assert_called_once_with(12345)
+        mock_message.from_user = SimpleNamespace(id=12345)
+
+        await notifications_command(mock_message, notification_service)
+
+        notification_service.get_or_create_settings.assert_called_once_with(12345)
         mock_message.answer.assert_called_once()
         call_args = mock_message.answer.call_args
         assert (
@@ -48,39 +39,28 @@ class TestNotificationsHandlers:
         assert call_args[1]["reply_markup"] is not None
         assert call_args[1]["parse_mode"] == "Markdown"
 
-    @pytest.mark.asyncio
-    async def test_notifications_command_no_user(self):
+    async def test_notifications_command_no_user(
+        self, mock_message, notification_service
+    ):
         """Test notifications command with no user"""
-        mock_message = Mock(spec=Message)
         mock_message.from_user = None
-        mock_message.answer = AsyncMock()
-
-        mock_notification_service = AsyncMock()
 
-        await notifications_command(mock_message, mock_notification_service)
+        await notifications_command(mock_message, notification_service)
 
-        mock_notification_service.get_or_create_settings.assert_not_called()
+        notification_service.get_or_create_settings.assert_not_called()
         mock_message.answer.assert_not_called()
 
-    @pytest.mark.asyncio
-    async def test_notifications_command_mixed_settings(self):
+    async def test_notifications_command_mixed_settings(
+        self, mock_message, notification_settings, notification_service
+    ):
         """Test notifications command with mixed notification settings"""
-        mock_message = Mock(spec=Message)
-        mock_message.answer = AsyncMock()
-        mock_message.from_user = Mock()
-        mock_message.from_user.id = 12345
-
-        mock_notification_service = AsyncMock()
-        mock_settings = Mock()
-        mock_settings.notify_on_due = True
-        mock_settings.notify_1_hour = False
-        mock_settings.notify_3_hours = True
-        mock_settings.notify_1_day = False
-        mock_settings.notify_3_days = True
-        mock_settings.notify_1_week = False
-        mock_notification_service.get_or_create_settings.return_value = mock_settings
-
-        await notifications_command(mock_message, mock_notification_service)
+        mock_message.from_user = SimpleNamespace(id=12345)
+
+        notification_settings.notify_1_hour = False
+        notification_settings.notify_1_day = False
+        notification_settings.notify_1_week = False
+
+        await notifications_command(mock_message, notification_service)
 
         call_text = mock_message.answer.call_args[0][0]
         assert "✅ При наступлении срока" in call_text
@@ -90,181 +70,106 @@ class TestNotificationsHandlers:
         assert "✅ За 3 дня" in call_text
         assert "❌ За неделю" in call_text
 
-    @pytest.mark.asyncio
-    async def test_toggle_notification_on_due(self):
+    async def test_toggle_notification_on_due(
+        self, mock_callback, notification_service
+    ):
         """Test toggling notification on due"""
-        mock_callback = Mock(spec=CallbackQuery)
         mock_callback.data = "notif_toggle:notify_on_due"
-        mock_callback.from_user = Mock()
-        mock_callback.from_user.id = 12345
-        mock_callback.answer = AsyncMock()
+        mock_callback.from_user = SimpleNamespace(id=12345)
         mock_callback.message = Mock()
         mock_callback.message.edit_text = AsyncMock()
 
-        mock_notification_service = AsyncMock()
-        mock_settings = Mock()
-        mock_settings.notify_on_due = True
-        mock_settings.notify_1_hour = True
-        mock_settings.notify_3_hours = True
-        mock_settings.notify_1_day = True
-        mock_settings.notify_3_days = True
-        mock_settings.notify_1_week = True
-        mock_notification_service.get_or_create_settings.return_value = mock_settings
-
-        await toggle_notification(mock_callback, mock_notification_service)
+        await toggle_notification(mock_callback, notification_service)
 
         # Called twice: once to get current value, once to get updated value
-        assert mock_notification_service.get_or_create_settings.call_count == 2
-        mock_notification_service.update_settings.assert_called_once_with(
+        assert notification_service.get_or_create_settings.call_count == 2
+        notification_service.update_settings.assert_called_once_with(
             12345, notify_on_due=False
         )
         mock_callback.message.edit_text.assert_called_once()
         mock_callback.answer.assert_called_once_with("Настройка обновлена!")
 
-    @pytest.mark.asyncio
-    async def test_toggle_notification_1_hour(self):
+    async def test_toggle_notification_1_hour(
+        self, mock_callback, notification_settings, notification_service
+    ):
         """Test toggling notification 1 hour"""
-        mock_callback = Mock(spec=CallbackQuery)
         mock_callback.data = "notif_toggle:notify_1_hour"
-        mock_callback.from_user = Mock()
-        mock_callback.from_user.id = 12345
-        mock_callback.answer = AsyncMock()
+        mock_callback.from_user = SimpleNamespace(id=12345)
         mock_callback.message = Mock()
         mock_callback.message.edit_text = AsyncMock()
 
-        mock_notification_service = AsyncMock()
-        mock_settings = Mock()
-        mock_settings.notify_on_due = True
-        mock_settings.notify_1_hour = False
-        mock_settings.notify_3_hours = True
-        mock_settings.notify_1_day = True
-        mock_settings.notify_3_days = True
-        mock_settings.notify_1_week = True
-        mock_notification_service.get_or_create_settings.return_value = mock_settings
+        notification_settings.notify_1_hour = False
 
-        await toggle_notification(mock_callback, mock_notification_service)
+        await toggle_notification(mock_callback, notification_service)
 
         # Called twice: once to get current value, once to get updated value
-        assert mock_notification_service.get_or_create_settings.call_count == 2
-        mock_notification_service.update_settings.assert_called_once_with(
+        assert notification_service.get_or_create_settings.call_count == 2
+        notification_service.update_settings.assert_called_once_with(
             12345, notify_1_hour=True
         )
         mock_callback.message.edit_text.assert_called_once()
         mock_callback.answer.assert_called_once_with("Настройка обновлена!")
 
-    @pytest.mark.asyncio
-    async def test_toggle_notification_inaccessible_message(self):
+    async def test_toggle_notification_inaccessible_message(
+        self, mock_callback, notification_service
+    ):
         """Test toggling notification with inaccessible message"""
-        mock_callback = Mock(spec=CallbackQuery)
         mock_callback.data = "notif_toggle:notify_3_hours"
-        mock_callback.from_user = Mock()
-        mock_callback.from_user.id = 12345
-        mock_callback.answer = AsyncMock()
-        mock_callback.message = Mock(spec=InaccessibleMessage)
-
-        mock_notification_service = AsyncMock()
-        mock_settings = Mock()
-        mock_settings.notify_on_due = True
-        mock_settings.notify_1_hour = True
-        mock_settings.notify_3_hours = True
-        mock_settings.notify_1_day = True
-        mock_settings.notify_3_days = True
-        mock_settings.notify_1_week = True
-        mock_notification_service.get_or_create_settings.return_value = mock_settings
-
-        await toggle_notification(mock_callback, mock_notification_service)
-
-        mock_notification_service.update_settings.assert_called_once()
+        mock_callback.from_user = SimpleNamespace(id=12345)
+        mock_callback.message = InaccessibleMessage.model_construct()
+
+        await toggle_notification(mock_callback, notification_service)
+
+        notification_service.update_settings.assert_called_once()
         mock_callback.answer.assert_called_once_with("Настройка обновлена!")
 
-    @pytest.mark.asyncio
-    async def test_toggle_notification_message_edit_fails(self):
+    async def test_toggle_notification_message_edit_fails(
+        self, mock_callback, notification_service
+    ):
         """Test toggling notification when message edit fails"""
-        mock_callback = Mock(spec=CallbackQuery)
         mock_callback.data = "notif_toggle:notify_1_day"
-        mock_callback.from_user = Mock()
-        mock_callback.from_user.id = 12345
-        mock_callback.answer = AsyncMock()
-        mock_callback.message = Mock()
-        mock_callback.message.edit_text = AsyncMock(
-            side_effect=Exception("Edit failed")
-        )
+        mock_callback.from_user = SimpleNamespace(id=12345)
+
+        async def _edit_fails(*args, **kwargs):
+            raise RuntimeError("Edit failed")
 
-        mock_notification_service = AsyncMock()
-        mock_settings = Mock()
-        mock_settings.notify_on_due = True
-        mock_settings.notify_1_hour = True
-        mock_settings.notify_3_hours = True
-        mock_settings.notify_1_day = True
-        mock_settings.notify_3_days = True
-        mock_settings.notify_1_week = True
-        mock_notification_service.get_or_create_settings.return_value = mock_settings
+        mock_callback.message = Mock()
+        mock_callback.message.edit_text = Mock(side_effect=_edit_fails)
 
-        await toggle_notification(mock_callback, mock_notification_service)
+        await toggle_notification(mock_callback, notification_service)
 
-        mock_notification_service.update_settings.assert_called_once()
+        mock_callback.message.edit_text.assert_called_once()
+        notification_service.update_settings.assert_called_once()
         mock_callback.answer.assert_called_once_with("Настройка обновлена!")
 
-    @pytest.mark.asyncio
-    async def test_toggle_notification_no_message(self):
+    async def test_toggle_notification_no_message(
+        self, mock_callback, notification_service
+    ):
         """Test toggling notification with no message"""
-        mock_callback = Mock(spec=CallbackQuery)
         mock_callback.data = "notif_toggle:notify_3_days"
-        mock_callback.from_user = Mock()
-        mock_callback.from_user.id = 12345
-        mock_callback.answer = AsyncMock()
+        mock_callback.from_user = SimpleNamespace(id=12345)
         mock_callback.message = None
 
-        mock_notification_service = AsyncMock()
-        mock_settings = Mock()
-        mock_settings.notify_on_due = True
-        mock_settings.notify_1_hour = True
-        mock_settings.notify_3_hours = True
-        mock_settings.notify_1_day = True
-        mock_settings.notify_3_days = True
-        mock_settings.notify_1_week = True
-        mock_notification_service.get_or_create_settings.return_value = mock_settings
-
-        await toggle_notification(mock_callback, mock_notification_service)
+        await toggle_notification(mock_callback, notification_service)
 
-        mock_notification_service.update_settings.assert_called_once()
+        notification_service.update_settings.assert_called_once()
         mock_callback.answer.assert_called_once_with("Настройка обновлена!")
 
-    @pytest.mark.asyncio
-    async def test_toggle_notification_all_fields(self):
-        """Test toggling all notification fields"""
-        fields = [
-            "notify_on_due",
-            "notify_1_hour",
-            "notify_3_hours",
-            "notify_1_day",
-            "notify_3_days",
-            "notify_1_week",
-        ]
-
-        for field in fields:
-            mock_callback = Mock(spec=CallbackQuery)
-            mock_callback.data = f"notif_toggle:{field}"
-            mock_callback.from_user = Mock()
-            mock_callback.from_user.id = 12345
-            mock_callback.answer = AsyncMock()
-            mock_callback.message = Mock()
-            mock_callback.message.edit_text = AsyncMock()
-
-            mock_notification_service = AsyncMock()
-            mock_settings = Mock()
-            # Set all to True initially
-            for f in fields:
-                setattr(mock_settings, f, True)
-            mock_notification_service.get_or_create_settings.return_value = (
-                mock_settings
-            )
-
-            await toggle_notification(mock_callback, mock_notification_service)
-
-            assert mock_notification_service.get_or_create_settings.call_count == 2
-            mock_notification_service.update_settings.assert_called_once_with(
-                12345, **{field: False}
-            )
-            mock_callback.message.edit_text.assert_called_once()
-            mock_callback.answer.assert_called_once_with("Настройка обновлена!")
+    @pytest.mark.parametrize("field", _NOTIFICATION_FIELDS)
+    async def test_toggle_notification_all_fields(
+        self, mock_callback, notification_service, field
+    ):
+        """Test toggling each notification field off"""
+        mock_callback.data = f"notif_toggle:{field}"
+        mock_callback.from_user = SimpleNamespace(id=12345)
+        mock_callback.message = Mock()
+        mock_callback.message.edit_text = AsyncMock()
+
+        await toggle_notification(mock_callback, notification_service)
+
+        assert notification_service.get_or_create_settings.call_count == 2
+        notification_service.update_settings.assert_called_once_with(
+            12345, **{field: False}
+        )
+        mock_callback.message.edit_text.assert_called_once()
+        mock_callback.answer.assert_called_once_with("Настройка обновлена!")
@@ -1,20 +1,11 @@
-from unittest.mock import AsyncMock, Mock
-
-import pytest
-from aiogram.types import Message
-
 from handlers.start_router import start
 
 
 class TestStartRouter:
     """Test cases for start router handlers"""
 
-    @pytest.mark.asyncio
-    async def test_start_command(self):
+    async def test_start_command(self, mock_message):
         """Test start command handler"""
-        mock_message = Mock(spec=Message)
-        mock_message.answer = AsyncMock()
-
         await start(mock_message)
 
         mock_message.answer.assert_called_once_with(
@@ -4,7 +4,7 @@ from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 import pytest_asyncio
-from sqlalchemy import select
+from sqlalchemy import insert, select
 
 from db.models import Deadline, NotificationSettings, SentNotification
 from exceptions import (
@@ -17,11 +17,13 @@ from services.notification_service import NotificationService
 class TestNotificationService:
     """Test cases for NotificationService"""
 
-    @pytest.mark.asyncio
-    async def test_get_or_create_settings_creates_new(self, db_session, sample_user):
-        """Test creating new notification settings"""
-        service = NotificationService(db_session)
+    @pytest.fixture
+    def service(self, db_session):
+        """NotificationService bound to the per-test session factory"""
+        return NotificationService(db_session)
 
+    async def test_get_or_create_settings_creates_new(self, service, sample_user):
+        """Test creating new notification settings"""
         settings = await service.get_or_create_settings(sample_user.id)
 
         assert settings.user_id == sample_user.id
@@ -31,13 +33,10 @@ class TestNotificationService:
         assert settings.notify_3_hours is False
         assert settings.notify_1_hour is False
 
-    @pytest.mark.asyncio
     async def test_get_or_create_settings_returns_existing(
-        self, db_session, sample_notification_settings
+        self, service, sample_notification_settings
     ):
         """Test returning existing notification settings"""
-        service = NotificationService(db_session)
-
         settings = await service.get_or_create_settings(
             sample_notification_settings.user_id
         )
@@ -45,12 +44,10 @@ class TestNotificationService:
         assert settings.id == sample_notification_settings.id
         assert settings.user_id == sample_notification_settings.user_id
 
-    @pytest.mark.asyncio
     async def test_get_or_create_settings_raise_exception(
-        self, db_session, sample_user, caplog
+        self, service, sample_user, caplog
     ):
         """Test raising infrastructure exception"""
-        service = NotificationService(db_session)
         caplog.set_level(logging.ERROR)
 
         service.session_factory = Mock(side_effect=Exception("Something went wrong"))
@@ -60,11 +57,9 @@ class TestNotificationService:
 
     @pytest_asyncio.fixture
     async def test_update_settings_existing_user(
-        self, db_session, sample_notification_settings
+        self, service, sample_notification_settings
     ):
         """Test updating settings for existing user"""
-        service = NotificationService(db_session)
-
         settings = await service.update_settings(
             sample_notification_settings.user_id,
             notify_1_week=False,
@@ -76,11 +71,8 @@ class TestNotificationService:
         assert settings.notify_3_days is False
         assert settings.notify_3_hours is False
 
-    @pytest.mark.asyncio
-    async def test_update_settings_new_user(self, db_session, sample_user):
+    async def test_update_settings_new_user(self, service, sample_user):
         """Test updating settings for new user (creates new)"""
-        service = NotificationService(db_session)
-
         settings = await service.update_settings(
             sample_user.id, notify_1_week=True, notify_1_day=True
         )
@@ -90,53 +82,42 @@ class TestNotificationService:
         assert settings.notify_1_day is True
         assert settings.notify_3_days is False  # default
 
-    @pytest.mark.asyncio
     async def test_update_settings_invalid_field_raises_error(
-        self, db_session, sample_user
+        self, service, sample_user
     ):
         """Test updating with invalid field raises error"""
-        service = NotificationService(db_session)
-
         with pytest.raises(ValidationError):
             await service.update_settings(
                 sample_user.id,
                 invalid_field=True,  # not a valid field
             )
 
-    @pytest.mark.asyncio
-    async def test_update_settings_existing(self, db_session, sample_user):
+    async def test_update_settings_existing(
+        self, service, sample_user, sample_notification_settings
+    ):
         """Test updating existing notification settings"""
-        service = NotificationService(db_session)
-
-        async with db_session() as session:
-            settings = NotificationSettings(
-                user_id=sample_user.id,
-                notify_1_week=False,
-                notify_3_days=False,
-                notify_1_day=False,
-                notify_3_hours=False,
-                notify_1_hour=False,
-            )
-            session.add(settings)
-            await session.commit()
-            await session.refresh(settings)
-
-            original_id = settings.id
+        original_id = sample_notification_settings.id
 
         updated = await service.update_settings(
             sample_user.id,
-            notify_1_week=True,
-            notify_1_day=True,
+            notify_1_week=False,
+            notify_1_day=False,
         )
 
         assert updated.id == original_id
         assert updated.user_id == sample_user.id
-        assert updated.notify_1_week is True
-        assert updated.notify_1_day is True
+        assert updated.notify_1_week is False
+        assert updated.notify_1_day is False
 
-        assert updated.notify_3_days is False
-        assert updated.notify_3_hours is False
-        assert updated.notify_1_hour is False
+        assert updated.notify_3_days is True
+        assert updated.notify_3_hours is True
+        assert updated.notify_1_hour is True
+
+    async def test_update_settings_persists_to_db(
+        self, service, db_session, sample_user, sample_notification_settings
+    ):
+        """Test that an update is committed, not only returned"""
+        await service.update_settings(sample_user.id, notify_1_week=False)
 
         async with db_session() as session:
             res = await session.execute(
@@ -146,27 +127,28 @@ class TestNotificationService:
             )
             db_settings = res.scalar_one()
 
-            assert db_settings.id == original_id
-            assert db_settings.notify_1_week is True
-            assert db_settings.notify_1_day is True
+        assert db_settings.id == sample_notification_settings.id
+        assert db_settings.notify_1_week is False
 
-    @pytest.mark.asyncio
-    async def test_update_notification_error(self, db_session, caplog, sample_user):
-        service = NotificationService(db_session)
+    async def test_update_settings_no_fields_returns_existing(
+        self, service, sample_user, sample_notification_settings
+    ):
+        """Test updating with no fields returns existing settings unchanged"""
+        settings = await service.update_settings(sample_user.id)
 
-        async with db_session() as session:
-            settings = NotificationSettings(
-                user_id=sample_user.id,
-                notify_1_week=False,
-                notify_3_days=False,
-                notify_1_day=False,
-                notify_3_hours=False,
-                notify_1_hour=False,
-            )
-            session.add(settings)
-            await session.commit()
-            await session.refresh(settings)
+        assert settings.id == sample_notification_settings.id
+        assert settings.notify_1_week is True
+        assert settings.notify_1_day is True
+
+    async def test_update_settings_no_fields_new_user(self, service, sample_user):
+        """Test updating with no fields creates default settings"""
+        settings = await service.update_settings(sample_user.id)
+
+        assert settings.user_id == sample_user.id
+        assert settings.notify_1_week is False
+        assert settings.notify_1_hour is False
 
+    async def test_update_notification_error(self, service, caplog, sample_user):
         caplog.set_level(logging.ERROR)
 
         service.session_factory = Mock(side_effect=Exception("Something went wrong"))
@@ -181,40 +163,35 @@ class TestNotificationService:
                 notify_1_hour=True,
             )
 
-    @pytest.mark.asyncio
-    async def test_get_deadlines_for_notifications_empty(self, db_session):
+    async def test_get_deadlines_for_notifications_empty(self, service):
         """Test getting notifications when no deadlines exist"""
-        service = NotificationService(db_session)
-
         notifications = await service.get_deadlines_for_notifications()
 
         assert notifications == []
 
-    @pytest.mark.asyncio
     async def test_get_deadlines_for_notifications_with_deadlines(
-        self, db_session, sample_deadline, sample_notification_settings
+        self, service, db_session, sample_deadline, sample_notification_settings
     ):
         """Test getting notifications for deadlines"""
-        service = NotificationService(db_session)
-
         # Create a deadline that should trigger notifications
+        now = datetime.now(timezone.utc)
         async with db_session() as session:
-            # Create deadline due in 1 hour
-            deadline_1h = Deadline(
-                user_id=sample_deadline.user_id,
-                title="Due in 1 hour",
-                deadline_at=datetime.now(timezone.utc) + timedelta(hours=1, minutes=1),
-            )
-            session.add(deadline_1h)
-
-            # Create deadline due in 1 day
-            deadline_1d = Deadline(
-                user_id=sample_deadline.user_id,
-                title="Due in 1 day",
-                deadline_at=datetime.now(timezone.utc) + timedelta(days=1, minutes=1),
+            # One deadline due in 1 hour and one due in 1 day
+            await session.execute(
+                insert(Deadline),
+                [
+                    {
+                        "user_id": sample_deadline.user_id,
+                        "title": "Due in 1 hour",
+                        "deadline_at": now + timedelta(hours=1, minutes=1),
+                    },
+                    {
+                        "user_id": sample_deadline.user_id,
+                        "title": "Due in 1 day",
+                        "deadline_at": now + timedelta(days=1, minutes=1),
+                    },
+                ],
             )
-            session.add(deadline_1d)
-
             await session.commit()
 
         notifications = await service.get_deadlines_for_notifications()
@@ -230,13 +207,10 @@ class TestNotificationService:
             assert "settings" in notification
             assert notification["deadline"].title in ["Due in 1 hour", "Due in 1 day"]
 
-    @pytest.mark.asyncio
     async def test_get_deadlines_for_notifications_no_settings(
-        self, db_session, sample_deadline
+        self, service, db_session, sample_deadline
     ):
         """Test getting notifications when user has no settings"""
-        service = NotificationService(db_session)
-
         # Create a deadline that would trigger notification if settings existed
         async with db_session() as session:
             deadline_1h = Deadline(
@@ -252,13 +226,10 @@ class TestNotificationService:
         # Should be empty because no notification settings
         assert notifications == []
 
-    @pytest.mark.asyncio
     async def test_get_deadlines_for_notifications_already_sent(
-        self, db_session, sample_deadline, sample_notification_settings
+        self, service, db_session, sample_deadline, sample_notification_settings
     ):
         """Test that already sent notifications are not returned"""
-        service = NotificationService(db_session)
-
         # Create a deadline and mark notification as sent
         async with db_session() as session:
             deadline_1h = Deadline(
@@ -267,8 +238,8 @@ class TestNotificationService:
                 deadline_at=datetime.now(timezone.utc) + timedelta(hours=1, minutes=1),
             )
             session.add(deadline_1h)
-            await session.commit()
-            await session.refresh(deadline_1h)
+            # Flush assigns deadline_1h.id without a separate commit and refresh
+            await session.flush()
 
             # Mark as already sent
             sent_notification = SentNotification(
@@ -283,13 +254,10 @@ class TestNotificationService:
         hour_notifications = [n for n in notifications if n["type"] == "1_hour"]
         assert len(hour_notifications) == 0
 
-    @pytest.mark.asyncio
     async def test_get_deadlines_for_notifications_different_timeframes(
-        self, db_session, sample_user
+        self, service, db_session, sample_user
     ):
         """Test notifications for different timeframes"""
-        service = NotificationService(db_session)
-
         # Create notification settings for all timeframes
         await service.update_settings(
             sample_user.id,
@@ -310,12 +278,13 @@ class TestNotificationService:
                 ("1 hour", datetime.now(timezone.utc) + timedelta(hours=1, minutes=1)),
             ]
 
-            for title, deadline_at in deadlines_data:
-                deadline = Deadline(
-                    user_id=sample_user.id, title=title, deadline_at=deadline_at
-                )
-                session.add(deadline)
-
+            await session.execute(
+                insert(Deadline),
+                [
+                    {"user_id": sample_user.id, "title": title, "deadline_at": at}
+                    for title, at in deadlines_data
+                ],
+            )
             await session.commit()
 
         notifications = await service.get_deadlines_for_notifications()
@@ -325,11 +294,8 @@ class TestNotificationService:
         expected_types = {"1_week", "3_days", "1_day", "3_hours", "1_hour"}
         assert notification_types == expected_types
 
-    @pytest.mark.asyncio
-    async def test_was_sent_true(self, db_session, sample_deadline):
+    async def test_was_sent_true(self, service, db_session, sample_deadline):
         """Test checking if notification was sent - already sent"""
-        service = NotificationService(db_session)
-
         # Mark notification as sent
         async with db_session() as session:
             sent_notification = SentNotification(
@@ -342,20 +308,14 @@ class TestNotificationService:
 
         assert result is True
 
-    @pytest.mark.asyncio
-    async def test_was_sent_false(self, db_session, sample_deadline):
+    async def test_was_sent_false(self, service, sample_deadline):
         """Test checking if notification was sent - not sent"""
-        service = NotificationService(db_session)
-
         result = await service._was_sent(sample_deadline.id, "1_hour")
 
         assert result is False
 
-    @pytest.mark.asyncio
-    async def test_was_sent_different_type(self, db_session, sample_deadline):
+    async def test_was_sent_different_type(self, service, db_session, sample_deadline):
         """Test checking different notification type"""
-        service = NotificationService(db_session)
-
         # Mark 1_hour notification as sent
         async with db_session() as session:
             sent_notification = SentNotification(
@@ -369,11 +329,8 @@ class TestNotificationService:
 
         assert result is False
 
-    @pytest.mark.asyncio
-    async def test_mark_was_sent_error(self, db_session, sample_deadline):
+    async def test_mark_was_sent_error(self, service, db_session, sample_deadline):
         """Test marking notification as sent with error"""
-        service = NotificationService(db_session)
-
         service.session_factory = Mock(side_effect=Exception("Something went wrong"))
 
         with pytest.raises(Exception):
@@ -396,11 +353,8 @@ class TestNotificationService:
             sent_record = await session.execute(q)
             assert sent_record.scalar_one_or_none() is None
 
-    @pytest.mark.asyncio
-    async def test_mark_as_sent(self, db_session, sample_deadline):
+    async def test_mark_as_sent(self, service, db_session, sample_deadline):
         """Test marking notification as sent"""
-        service = NotificationService(db_session)
-
         await service.mark_as_sent(sample_deadline.id, "1_hour")
 
         # Verify it was marked
@@ -420,11 +374,8 @@ class TestNotificationService:
             sent_record = await session.execute(q)
             assert sent_record.scalar_one_or_none() is not None
 
-    @pytest.mark.asyncio
-    async def test_mark_as_sent_multiple_types(self, db_session, sample_deadline):
+    async def test_mark_as_sent_multiple_types(self, service, sample_deadline):
         """Test marking multiple notification types as sent"""
-        service = NotificationService(db_session)
-
         await service.mark_as_sent(sample_deadline.id, "1_hour")
         await service.mark_as_sent(sample_deadline.id, "1_day")
 
@@ -432,11 +383,28 @@ class TestNotificationService:
         assert await service._was_sent(sample_deadline.id, "1_hour") is True
         assert await service._was_sent(sample_deadline.id, "1_day") is True
 
-    @pytest.mark.asyncio
+    async def test_mark_as_sent_duplicate_ignored(self, service, sample_deadline):
+        """Test marking the same notification twice does not raise"""
+        await service.mark_as_sent(sample_deadline.id, "1_hour")
+        await service.mark_as_sent(sample_deadline.id, "1_hour")
+
+    async def test_mark_as_sent_other_integrity_error(self, service):
+        """Test a constraint failure other than a duplicate is not swallowed"""
+        with pytest.raises(NotificationError):
+            await service.mark_as_sent(None, "1_hour")
+
+    async def test_mark_as_sent_integrity_error_check_fails(self, service):
+        """Test an IntegrityError is raised when the duplicate check itself fails"""
+        service.session_factory = Mock(
+            side_effect=[service.session_factory(), Exception("Database down")]
+        )
+
+        with pytest.raises(NotificationError):
+            await service.mark_as_sent(None, "1_hour")
+
     async def test_get_deadlines_for_notifications_handles_deadline_errors(
-        self, db_session, sample_user, caplog
+        self, service, db_session, sample_user, caplog
     ):
-        service = NotificationService(db_session)
         caplog.set_level(logging.ERROR)
 
         now = datetime.now(timezone.utc)
@@ -465,13 +433,11 @@ class TestNotificationService:
             "Error processing deadline" in record.message for record in caplog.records
         )
 
-    @pytest.mark.asyncio
     async def test_get_deadlines_for_notifications_error_handling(
-        self, db_session, caplog
+        self, service, caplog
     ):
         caplog.set_level(logging.ERROR)
 
-        service = NotificationService(db_session)
 
         service.session_factory = MagicMock(side_effect=Exception("Database error"))
 
@@ -1,4 +1,6 @@
+import asyncio
 from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -23,14 +25,12 @@ class TestHealthChecker:
         """Create health checker instance"""
         return HealthChecker(mock_session_factory)
 
-    @pytest.mark.asyncio
     async def test_init(self, mock_session_factory):
         """Test health checker initialization"""
         checker = HealthChecker(mock_session_factory)
         assert checker.session_factory == mock_session_factory
         assert checker.startup_time is not None
 
-    @pytest.mark.asyncio
     async def test_check_database_success(self, health_checker):
         """Test successful database check"""
         with patch.object(health_checker, "session_factory") as mock_factory:
@@ -44,7 +44,6 @@ class TestHealthChecker:
             assert result["status"] == "healthy"
             assert "response" in result
 
-    @pytest.mark.asyncio
     async def test_check_database_failure(self, health_checker):
         """Test database check failure"""
         with patch.object(health_checker, "session_factory") as mock_factory:
@@ -55,7 +54,26 @@ class TestHealthChecker:
             assert result["status"] == "unhealthy"
             assert "error" in result
 
-    @pytest.mark.asyncio
+    async def test_check_database_result_is_cached(self, health_checker, monkeypatch):
+        """Test probes within the TTL share one query and a later probe re-runs it"""
+        now = [100.0]
+        # Only the health module's clock is faked; the event loop keeps its own
+        monkeypatch.setattr(
+            "utils.health.time", SimpleNamespace(monotonic=lambda: now[0])
+        )
+
+        first = await health_checker.check_database()
+        now[0] += 0.5
+        second = await health_checker.check_database()
+
+        assert second is first
+        assert health_checker.session_factory.call_count == 1
+
+        now[0] += 1.0
+        await health_checker.check_database()
+
+        assert health_checker.session_factory.call_count == 2
+
     async def test_check_scheduler_running(self, health_checker):
         """Test scheduler check when running"""
         mock_scheduler = MagicMock()
@@ -74,7 +92,6 @@ class TestHealthChecker:
         assert result["scheduler_running"] is True
         assert result["jobs_count"] == 2
 
-    @pytest.mark.asyncio
     async def test_check_scheduler_not_running(self, health_checker):
         """Test scheduler check when not running"""
         with patch.object(health_checker, "check_scheduler") as mock_check:
@@ -87,7 +104,6 @@ class TestHealthChecker:
         assert result["status"] == "unhealthy"
         assert "error" in result
 
-    @pytest.mark.asyncio
     async def test_check_memory_usage(self, health_checker):
         """Test memory usage check"""
         with patch.object(health_checker, "check_memory_usage") as mock_check:
@@ -104,20 +120,27 @@ class TestHealthChecker:
             assert result["vms_mb"] == 200.0
             assert result["memory_percent"] == 50.5
 
-    @pytest.mark.asyncio
-    async def test_check_memory_usage_no_psutil(self, health_checker):
+    async def test_check_memory_usage_reuses_process_handle(self, health_checker):
+        """Test the psutil process handle is created once and reused"""
+        pytest.importorskip("psutil")
+
+        first = await health_checker.check_memory_usage()
+        process = health_checker._process
+        second = await health_checker.check_memory_usage()
+
+        assert first["status"] == second["status"] == "healthy"
+        assert process is not None
+        assert health_checker._process is process
+
+    async def test_check_memory_usage_no_psutil(self, health_checker, monkeypatch):
         """Test memory usage check when psutil not available"""
-        with patch.object(health_checker, "check_memory_usage") as mock_check:
-            mock_check.return_value = {
-                "status": "skipped",
-                "error": "psutil not installed",
-            }
-            result = await health_checker.check_memory_usage()
+        monkeypatch.setattr("utils.health.psutil", None)
+
+        result = await health_checker.check_memory_usage()
 
-            assert result["status"] == "skipped"
-            assert "psutil not installed" in result["error"]
+        assert result["status"] == "skipped"
+        assert "psutil not installed" in result["error"]
 
-    @pytest.mark.asyncio
     async def test_get_uptime(self, health_checker):
         """Test uptime calculation"""
         health_checker.startup_time = datetime.now(timezone.utc) - timedelta(hours=1)
@@ -126,7 +149,6 @@ class TestHealthChecker:
 
         assert result.startswith("1h")
 
-    @pytest.mark.asyncio
     async def test_get_full_status_healthy(self, health_checker):
         """Test full status when all services are healthy"""
         with (
@@ -151,7 +173,6 @@ class TestHealthChecker:
             assert result["services"]["memory"]["status"] == "healthy"
             assert result["unhealthy_services"] is None
 
-    @pytest.mark.asyncio
     async def test_get_full_status_unhealthy(self, health_checker):
         """Test full status when some services are unhealthy"""
         with (
@@ -175,6 +196,48 @@ class TestHealthChecker:
             assert result["unhealthy_services"] is not None
             assert "scheduler: Not running" in result["unhealthy_services"]
 
+    async def test_get_full_status_check_cancelled(self, health_checker):
+        """Test a check raising a BaseException is reported as unhealthy"""
+        with (
+            patch.object(health_checker, "check_database") as mock_db,
+            patch.object(health_checker, "check_scheduler") as mock_scheduler,
+            patch.object(health_checker, "check_memory_usage") as mock_memory,
+        ):
+            mock_db.side_effect = asyncio.CancelledError()
+            mock_scheduler.return_value = {"status": "healthy"}
+            mock_memory.return_value = {"status": "healthy"}
+
+            result = await health_checker.get_full_status()
+
+            assert result["status"] == "unhealthy"
+            assert result["services"]["database"]["status"] == "unhealthy"
+            assert result["services"]["scheduler"]["status"] == "healthy"
+
+    async def test_get_full_status_runs_checks_concurrently(self, health_checker):
+        """Test the service checks are awaited together, not one after another"""
+        checks = ("check_database", "check_scheduler", "check_memory_usage")
+        started = []
+        all_started = asyncio.Event()
+
+        def make_check(name):
+            async def check():
+                started.append(name)
+                if len(started) == len(checks):
+                    all_started.set()
+                # Sequential awaits would block here forever on the first check
+                await all_started.wait()
+                return {"status": "healthy"}
+
+            return check
+
+        for name in checks:
+            setattr(health_checker, name, make_check(name))
+
+        result = await asyncio.wait_for(health_checker.get_full_status(), timeout=1)
+
+        assert sorted(started) == sorted(checks)
+        assert result["status"] == "healthy"
+
 
 class TestHealthCheckerManager:
     """Test suite for HealthCheckerManager"""
@@ -211,7 +274,6 @@ class TestHealthCheckerManager:
 class TestHealthCheckHandler:
     """Test suite for health check handler"""
 
-    @pytest.mark.asyncio
     async def test_health_check_handler_success(self):
         """Test health check handler success"""
         with patch("utils.health.get_health_checker") as mock_get_checker:
@@ -229,7 +291,6 @@ class TestHealthCheckHandler:
             assert result["status"] == "healthy"
             assert "timestamp" in result
 
-    @pytest.mark.asyncio
     async def test_health_check_handler_no_checker(self):
         """Test health check handler when checker not initialized"""
         with patch("utils.health.get_health_checker") as mock_get_checker:
@@ -240,7 +301,6 @@ class TestHealthCheckHandler:
             assert result["status"] == "unhealthy"
             assert "error" in result
 
-    @pytest.mark.asyncio
     async def test_health_check_handler_exception(self):
         """Test health check handler when exception occurs"""
         with patch("utils.health.get_health_checker") as mock_get_checker:
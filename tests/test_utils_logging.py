@@ -0,0 +1,53 @@
+import pytest
+from structlog.testing import capture_logs
+
+from utils.logging_config import get_logger
+
+
+class TestContextLogger:
+    """Test suite for ContextLogger"""
+
+    @pytest.mark.parametrize("level", ["debug", "info", "warning", "error", "critical"])
+    def test_unconfigured_logger_emits_with_context(self, level):
+        """Test logging works before setup_logging and carries bound context"""
+        logger = get_logger("test").bind(user_id=1)
+
+        with capture_logs() as logs:
+            getattr(logger, level)("Something happened", extra="value")
+
+        assert logs == [
+            {
+                "event": "Something happened",
+                "log_level": level,
+                "user_id": 1,
+                "extra": "value",
+            }
+        ]
+
+    def test_nested_bind_keeps_parent_context(self):
+        """Test a nested bind adds to the parent's context without changing it"""
+        parent = get_logger("test").bind(user_id=1)
+        child = parent.bind(request_id="abc")
+
+        with capture_logs() as logs:
+            child.info("From child")
+            parent.info("From parent")
+
+        assert logs == [
+            {
+                "event": "From child",
+                "log_level": "info",
+                "user_id": 1,
+                "request_id": "abc",
+            },
+            {"event": "From parent", "log_level": "info", "user_id": 1},
+        ]
+
+    def test_call_kwargs_override_bound_context(self):
+        """Test kwargs passed to a log call win over bound values"""
+        logger = get_logger("test").bind(user_id=1)
+
+        with capture_logs() as logs:
+            logger.info("Overridden", user_id=2)
+
+        assert logs == [{"event": "Overridden", "log_level": "info", "user_id": 2}]
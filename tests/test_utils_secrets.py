@@ -0,0 +1,134 @@
+from unittest.mock import Mock
+
+import pytest
+
+from utils.secrets import SecretsManager, init_secrets_from_env
+
+# The substring list init_secrets_from_env matched before it used one regex
+_OLD_SENSITIVE_KEYS = (
+    "BOT_TOKEN",
+    "DATABASE_URL",
+    "API_KEY",
+    "SECRET_KEY",
+    "PASSWORD",
+    "TOKEN",
+)
+
+
+@pytest.fixture
+def secrets_dir(tmp_path, monkeypatch):
+    """Run in a temp dir, since the secrets file path is relative"""
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def _spy_cipher(manager):
+    """Wrap the manager's Fernet so encrypt/decrypt calls can be counted"""
+    manager._fernet = Mock(wraps=manager._get_cipher())
+    return manager._fernet
+
+
+class TestSecretsManager:
+    """Test suite for SecretsManager"""
+
+    def test_load_reuses_cache_while_file_unchanged(self, secrets_dir):
+        """Test a second load skips the decrypt when the file is unchanged"""
+        SecretsManager().set_secret("BOT_TOKEN", "abc")
+        manager = SecretsManager()
+        cipher = _spy_cipher(manager)
+
+        assert manager.get_secret("BOT_TOKEN") == "abc"
+        assert manager.get_secret("BOT_TOKEN") == "abc"
+
+        assert cipher.decrypt.call_count == 1
+
+    def test_load_sees_write_from_other_instance(self, secrets_dir):
+        """Test the cache is dropped when another manager rewrites the file"""
+        reader = SecretsManager()
+        writer = SecretsManager()
+        writer.set_secret("BOT_TOKEN", "abc")
+        assert reader.get_secret("BOT_TOKEN") == "abc"
+
+        writer.set_secret("API_KEY", "xyz")
+
+        assert reader.get_secret("API_KEY") == "xyz"
+        assert sorted(reader.list_secrets()) == ["API_KEY", "BOT_TOKEN"]
+
+    def test_load_returns_copy_of_cache(self, secrets_dir):
+        """Test editing a loaded dict does not change the cached secrets"""
+        SecretsManager().set_secret("BOT_TOKEN", "abc")
+        manager = SecretsManager()
+
+        # First load decrypts the file, the second is served from the cache
+        for _ in range(2):
+            secrets = manager._load_secrets()
+            secrets["BOT_TOKEN"] = "changed"
+            secrets["EXTRA"] = "value"
+
+        assert manager._load_secrets() == {"BOT_TOKEN": "abc"}
+
+    def test_secrets_round_trip_through_encrypted_file(self, secrets_dir):
+        """Test secrets written by one manager decrypt unchanged in another"""
+        values = {"BOT_TOKEN": "123:abc", "GREETING": "Привет, мир ✓"}
+        writer = SecretsManager()
+        for key, value in values.items():
+            writer.set_secret(key, value)
+
+        raw = (secrets_dir / ".secrets.enc").read_bytes()
+        assert b"123:abc" not in raw
+        assert SecretsManager()._load_secrets() == values
+
+    def test_set_secrets_encrypts_and_writes_once(self, secrets_dir):
+        """Test storing several secrets costs a single encrypted write"""
+        manager = SecretsManager()
+        cipher = _spy_cipher(manager)
+
+        manager.set_secrets({"BOT_TOKEN": "abc", "API_KEY": "xyz", "PASSWORD": "p"})
+
+        assert cipher.encrypt.call_count == 1
+        assert SecretsManager()._load_secrets() == {
+            "BOT_TOKEN": "abc",
+            "API_KEY": "xyz",
+            "PASSWORD": "p",
+        }
+
+
+class TestInitSecretsFromEnv:
+    """Test suite for init_secrets_from_env"""
+
+    def test_picks_same_names_as_substring_check(self, secrets_dir, monkeypatch):
+        """Test the regex selects exactly what the old any() check selected"""
+        env = {
+            "BOT_TOKEN": "1",
+            "bot_token": "2",
+            "GITHUB_TOKEN": "3",
+            "TOKENIZER": "4",
+            "DATABASE_URL": "5",
+            "database_url_ro": "6",
+            "MY_API_KEY": "7",
+            "API_KEYS": "8",
+            "SECRET_KEY_BASE": "9",
+            "DB_PASSWORD": "10",
+            "Password": "11",
+            "EMPTY_TOKEN": "",
+            "API": "12",
+            "SECRET": "13",
+            "PASS": "14",
+            "DATABASE": "15",
+            "PATH": "16",
+            "HOME": "17",
+        }
+        expected = {
+            key: value
+            for key, value in env.items()
+            if value and any(s in key.upper() for s in _OLD_SENSITIVE_KEYS)
+        }
+        monkeypatch.setattr("utils.secrets.os.environ", env)
+        manager = SecretsManager()
+        monkeypatch.setattr("utils.secrets._secrets_manager", manager)
+        cipher = _spy_cipher(manager)
+
+        init_secrets_from_env()
+
+        assert manager._load_secrets() == expected
+        assert cipher.encrypt.call_count == 1
@@ -62,9 +62,12 @@ class TestTelegramUserValidation:
         with pytest.raises(ValueError, match="Bots are not allowed"):
             TelegramUserValidation(**data)
 
-    def test_invalid_username(self):
+    @pytest.mark.parametrize(
+        "username", ["invalid username!", "johndoe\n"], ids=["symbols", "newline"]
+    )
+    def test_invalid_username(self, username):
         """Test invalid username"""
-        data = {"user_id": 12345, "username": "invalid username!", "is_bot": False}
+        data = {"user_id": 12345, "username": username, "is_bot": False}
 
         with pytest.raises(ValueError, match="Invalid username format"):
             TelegramUserValidation(**data)
@@ -97,43 +100,27 @@ class TestDeadlineInputValidation:
         assert result.description is None
         assert result.due_date == "2024-12-31 23:59"
 
-    def test_empty_title(self):
-        """Test empty title"""
-        data = {"title": "", "due_date": "2024-12-31 23:59"}
-
-        with pytest.raises(ValueError, match="Title cannot be empty"):
-            DeadlineInputValidation(**data)
-
-    def test_title_too_long(self):
-        """Test title too long"""
-        data = {"title": "x" * 201, "due_date": "2024-12-31 23:59"}
-
-        with pytest.raises(ValueError, match="Title too long"):
-            DeadlineInputValidation(**data)
-
-    def test_title_with_whitespace(self):
-        """Test title with only whitespace"""
-        data = {"title": "   ", "due_date": "2024-12-31 23:59"}
-
-        with pytest.raises(ValueError, match="Title cannot be empty"):
-            DeadlineInputValidation(**data)
-
-    def test_empty_due_date(self):
-        """Test empty due date"""
-        data = {"title": "Test", "due_date": ""}
-
-        with pytest.raises(ValueError, match="Due date cannot be empty"):
-            DeadlineInputValidation(**data)
-
-    def test_description_too_long(self):
-        """Test description too long"""
-        data = {
-            "title": "Test",
-            "description": "x" * 1001,
-            "due_date": "2024-12-31 23:59",
-        }
-
-        with pytest.raises(ValueError, match="Description too long"):
+    @pytest.mark.parametrize(
+        "overrides,match",
+        [
+            pytest.param({"title": ""}, "Title cannot be empty", id="empty_title"),
+            pytest.param({"title": "x" * 201}, "Title too long", id="title_too_long"),
+            pytest.param(
+                {"title": "   "}, "Title cannot be empty", id="title_whitespace"
+            ),
+            pytest.param({"due_date": ""}, "Due date cannot be empty", id="empty_due"),
+            pytest.param(
+                {"description": "x" * 1001},
+                "Description too long",
+                id="description_too_long",
+            ),
+        ],
+    )
+    def test_invalid_deadline_input(self, overrides, match):
+        """Test each invalid field is rejected with its own message"""
+        data = {"title": "Test", "due_date": "2024-12-31 23:59", **overrides}
+
+        with pytest.raises(ValueError, match=match):
             DeadlineInputValidation(**data)
 
 
@@ -149,24 +136,19 @@ class TestNotificationSettingsValidation:
         assert result.enabled is True
         assert result.advance_hours == 24
 
-    def test_valid_advance_hours_range(self):
+    @pytest.mark.parametrize("hours", [0, 1, 24, 168])
+    def test_valid_advance_hours_range(self, hours):
         """Test valid advance hours range"""
-        for hours in [0, 1, 24, 168]:
-            data = {"enabled": True, "advance_hours": hours}
+        data = {"enabled": True, "advance_hours": hours}
 
-            result = NotificationSettingsValidation(**data)
-            assert result.advance_hours == hours
+        result = NotificationSettingsValidation(**data)
 
-    def test_invalid_advance_hours_negative(self):
-        """Test negative advance hours"""
-        data = {"enabled": True, "advance_hours": -1}
+        assert result.advance_hours == hours
 
-        with pytest.raises(ValueError, match="Advance hours must be between 0 and 168"):
-            NotificationSettingsValidation(**data)
-
-    def test_invalid_advance_hours_too_large(self):
-        """Test advance hours too large"""
-        data = {"enabled": True, "advance_hours": 169}
+    @pytest.mark.parametrize("hours", [-1, 169], ids=["negative", "too_large"])
+    def test_invalid_advance_hours_range(self, hours):
+        """Test advance hours outside 0..168 are rejected"""
+        data = {"enabled": True, "advance_hours": hours}
 
         with pytest.raises(ValueError, match="Advance hours must be between 0 and 168"):
             NotificationSettingsValidation(**data)
@@ -226,6 +208,13 @@ class TestValidationFunctions:
         assert len(result) == 50
         assert result.endswith("...")
 
+    def test_sanitize_text_whitespace_not_counted(self):
+        """Test surrounding whitespace is stripped before the length check"""
+        text = "  " + "x" * 48 + "  "
+        result = sanitize_text(text, max_length=50)
+
+        assert result == "x" * 48
+
     def test_sanitize_text_empty(self):
         """Test text sanitization with empty text"""
         result = sanitize_text("")
@@ -12,25 +12,41 @@ from exceptions import DeadlineBotError, ValidationError, DatabaseError
 logger = logging.getLogger(__name__)
 
 
+# All redactions in one alternation so the message is scanned once; the
+# matching group's name selects the replacement
+_SENSITIVE_RE = re.compile(
+    r"(?P<token>token[_\s]*=[\s'\"]+[a-zA-Z0-9_-]+)"
+    r"|(?P<password>password[_\s]*=[\s'\"]+[^\s'\"]+)"
+    r"|(?P<secret>secret[_\s]*=[\s'\"]+[^\s'\"]+)"
+    r"|(?P<api_key>api[_\s]*key[_\s]*=[\s'\"]+[^\s'\"]+)"
+    r"|(?P<path>/[^/\s]+/[^/\s]+|[A-Za-z]:\\[^\\\s]+\\[^\\\s]+)"
+    r"|(?P<id>\b\d{10,}\b)"
+)
+_REDACTIONS = {
+    "token": "token=[REDACTED]",
+    "password": "password=[REDACTED]",
+    "secret": "secret=[REDACTED]",
+    "api_key": "api_key=[REDACTED]",
+    "path": "[PATH]",
+    "id": "[ID]",
+}
+# Every pattern above needs at least one of these characters to match
+_REDACTION_TRIGGERS = frozenset("=/\\0123456789")
+
+
+def _redact(match: re.Match[str]) -> str:
+    return _REDACTIONS[match.lastgroup or ""]
+
+
 def _sanitize_error_message(message: str) -> str:
     """Remove sensitive information from error messages"""
     if not message:
         return "Unknown error"
 
-    # Remove potential sensitive patterns
-    message = re.sub(r"\b\d{10,}\b", "[ID]", message)  # Long numbers
-    message = re.sub(r'token[_\s]*=[\s\'"]+[a-zA-Z0-9_-]+', "token=[REDACTED]", message)
-    message = re.sub(
-        r'password[_\s]*=[\s\'"]+[^\s\'"]+', "password=[REDACTED]", message
-    )
-    message = re.sub(r'secret[_\s]*=[\s\'"]+[^\s\'"]+', "secret=[REDACTED]", message)
-    message = re.sub(
-        r'api[_\s]*key[_\s]*=[\s\'"]+[^\s\'"]+', "api_key=[REDACTED]", message
-    )
-
-    # Remove file paths
-    message = re.sub(r"/[^/\s]+/[^/\s]+", "[PATH]", message)
-    message = re.sub(r"[A-Za-z]:\\[^\\\s]+\\[^\\\s]+", "[PATH]", message)
+    # Remove long numbers, credentials and file paths; plain text such as
+    # validation messages has none of the trigger characters and is left as is
+    if not _REDACTION_TRIGGERS.isdisjoint(message):
+        message = _SENSITIVE_RE.sub(_redact, message)
 
     # Limit length
     if len(message) > 200:
@@ -80,18 +96,18 @@ def handle_errors(message: str = "Произошла ошибка. Попроб
     return decorator
 
 
+def _find_event(args: tuple, event_types) -> Any:
+    """Return the first handler argument of the given aiogram event type(s)"""
+    # aiogram passes the event first, so this normally stops at args[0]
+    return next((arg for arg in args if isinstance(arg, event_types)), None)
+
+
 async def _send_error_message(
     args: tuple, default_message: str, details: str | None = None
 ) -> None:
     """Send error message to user"""
 
-    # Find the message or callback query in args
-    message_or_callback = None
-    for arg in args:
-        if isinstance(arg, (Message, CallbackQuery)):
-            message_or_callback = arg
-            break
-
+    message_or_callback = _find_event(args, (Message, CallbackQuery))
     if not message_or_callback:
         logger.error("Cannot find message or callback to send error")
         return
@@ -160,13 +176,7 @@ async def _answer_callback(
 ) -> None:
     """Answer callback query with error message"""
 
-    # Find the callback query in args
-    callback = None
-    for arg in args:
-        if isinstance(arg, CallbackQuery):
-            callback = arg
-            break
-
+    callback = _find_event(args, CallbackQuery)
     if not callback:
         logger.error("Cannot find callback to answer with error")
         return
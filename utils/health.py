@@ -1,19 +1,50 @@
+import asyncio
 import logging
+import time
 from datetime import datetime, timezone
+from functools import wraps
 from typing import Any, Dict
 
 from sqlalchemy import text
 
+try:
+    import psutil
+except ImportError:  # optional; the memory check is skipped without it
+    psutil = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
 
+def _cached_check(ttl: float):
+    """Reuse a check's result for ttl seconds so bursts of probes share one run"""
+
+    def decorator(check):
+        @wraps(check)
+        async def wrapper(self) -> Dict[str, Any]:
+            now = time.monotonic()
+            cached = self._check_cache.get(check.__name__)
+            if cached is not None and now - cached[0] < ttl:
+                return cached[1]
+
+            result = await check(self)
+            self._check_cache[check.__name__] = (now, result)
+            return result
+
+        return wrapper
+
+    return decorator
+
+
 class HealthChecker:
     """Health check service for monitoring bot status"""
 
     def __init__(self, session_factory=None):
         self.session_factory = session_factory
         self.startup_time = datetime.now(timezone.utc)
+        self._check_cache: Dict[str, tuple[float, Dict[str, Any]]] = {}
+        self._process = None
 
+    @_cached_check(ttl=1.0)
     async def check_database(self) -> Dict[str, Any]:
         """Check database connectivity"""
         try:
@@ -57,21 +88,27 @@ class HealthChecker:
 
     async def check_memory_usage(self) -> Dict[str, Any]:
         """Check memory usage"""
+        if psutil is None:
+            return {"status": "skipped", "error": "psutil not installed"}
+
         try:
-            import psutil
+            # Keep one handle for the bot's own process; oneshot() lets
+            # memory_percent() reuse the memory_info() read instead of
+            # hitting procfs again
+            if self._process is None:
+                self._process = psutil.Process()
+            process = self._process
 
-            process = psutil.Process()
-            memory_info = process.memory_info()
+            with process.oneshot():
+                memory_info = process.memory_info()
+                memory_percent = process.memory_percent()
 
             return {
                 "status": "healthy",
                 "rss_mb": round(memory_info.rss / 1024 / 1024, 2),
                 "vms_mb": round(memory_info.vms / 1024 / 1024, 2),
-                "memory_percent": round(process.memory_percent(), 2),
+                "memory_percent": round(memory_percent, 2),
             }
-        except ImportError:
-            # psutil not available, skip memory check
-            return {"status": "skipped", "error": "psutil not installed"}
         except Exception as e:
             logger.error(f"Memory check failed: {e}")
             return {"status": "unhealthy", "error": str(e)}
@@ -88,21 +125,22 @@ class HealthChecker:
         """Get complete health status"""
         uptime = await self.get_uptime()
 
-        # Run all checks and handle exceptions individually
-        try:
-            db_check = await self.check_database()
-        except Exception as e:
-            db_check = {"status": "unhealthy", "error": str(e)}
-
-        try:
-            scheduler_check = await self.check_scheduler()
-        except Exception as e:
-            scheduler_check = {"status": "unhealthy", "error": str(e)}
-
-        try:
-            memory_check = await self.check_memory_usage()
-        except Exception as e:
-            memory_check = {"status": "unhealthy", "error": str(e)}
+        # The checks are independent, so run them concurrently; a check that
+        # raises is reported as unhealthy instead of failing the whole status
+        results = await asyncio.gather(
+            self.check_database(),
+            self.check_scheduler(),
+            self.check_memory_usage(),
+            return_exceptions=True,
+        )
+        db_check, scheduler_check, memory_check = (
+            (
+                {"status": "unhealthy", "error": str(r)}
+                if isinstance(r, BaseException)
+                else r
+            )
+            for r in results
+        )
 
         # Determine overall status
         overall_status = "healthy"
@@ -112,20 +150,12 @@ class HealthChecker:
             ("database", db_check),
             ("scheduler", scheduler_check),
         ]:
-            status = (
-                service_result.get("status")
-                if hasattr(service_result, "get")
-                else "unhealthy"
-            )
-            error = (
-                service_result.get("error")
-                if hasattr(service_result, "get")
-                else "Unknown error"
-            )
-
-            if status != "healthy" and status != "skipped":
+            # Exceptions were already turned into result dicts above
+            if service_result.get("status") not in ("healthy", "skipped"):
                 overall_status = "unhealthy"
-                unhealthy_services.append(f"{service_name}: {error}")
+                unhealthy_services.append(
+                    f"{service_name}: {service_result.get('error')}"
+                )
 
         return {
             "status": overall_status,
@@ -1,13 +1,23 @@
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Any, List, Optional
 
 import structlog
 
+# Background thread that writes queued records to the real handlers
+_listener: Optional[logging.handlers.QueueListener] = None
+
 
 def setup_logging(log_level: str = "INFO", log_file: Optional[str] = None) -> None:
     """Setup structured logging for the application"""
+    global _listener
+    # Configure once; a repeat call would only open handlers that never get used
+    if _listener is not None:
+        return
 
     # Convert string level to logging constant
     numeric_level = getattr(logging, log_level.upper(), logging.INFO)
@@ -39,31 +49,39 @@ def setup_logging(log_level: str = "INFO", log_file: Optional[str] = None) -> No
     # Configure standard logging
     handlers: List[logging.Handler] = []
 
+    # Console and file output share one format
+    formatter = logging.Formatter(
+        "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    )
+
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(numeric_level)
-    console_formatter = logging.Formatter(
-        "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-    )
-    console_handler.setFormatter(console_formatter)
+    console_handler.setFormatter(formatter)
     handlers.append(console_handler)
 
     # File handler if specified
     if log_file:
         file_handler = logging.FileHandler(log_file, encoding="utf-8")
         file_handler.setLevel(numeric_level)
-        file_formatter = logging.Formatter(
-            "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-        )
-        file_handler.setFormatter(file_formatter)
+        file_handler.setFormatter(formatter)
         handlers.append(file_handler)
 
-    # Root logger configuration
-    logging.basicConfig(
-        level=numeric_level,
-        handlers=handlers,
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    # Root logger configuration. The handlers write to stdout and disk, so
+    # they run on a listener thread and log calls only enqueue the record
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    _listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
     )
+    _listener.start()
+    # Flush whatever is still queued on interpreter exit
+    atexit.register(_listener.stop)
+
+    # The queued record carries only the rendered message (and traceback);
+    # the listener's handlers add the timestamp, name and level
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
+    logging.basicConfig(level=numeric_level, handlers=[queue_handler])
 
     # Set specific logger levels
     logging.getLogger("aiogram").setLevel(logging.WARNING)
@@ -74,35 +92,39 @@ def setup_logging(log_level: str = "INFO", log_file: Optional[str] = None) -> No
 class ContextLogger:
     """Helper class for adding context to log messages"""
 
-    def __init__(self, logger_name: str):
-        self.logger = structlog.get_logger(logger_name)
-        self._context: Dict[str, Any] = {}
+    __slots__ = ("name", "logger")
+
+    def __init__(self, logger_name: str, logger: Any = None):
+        self.name = logger_name
+        # Context is bound into the structlog logger itself, so log calls pass
+        # their kwargs straight through instead of merging a context dict
+        self.logger = (
+            logger if logger is not None else structlog.get_logger(logger_name)
+        )
 
     def bind(self, **kwargs) -> "ContextLogger":
         """Add context to the logger"""
-        new_logger = ContextLogger(self.logger.name)
-        new_logger._context = {**self._context, **kwargs}
-        return new_logger
+        return ContextLogger(self.name, self.logger.bind(**kwargs))
 
     def info(self, message: str, **kwargs):
         """Log info message with context"""
-        self.logger.info(message, **{**self._context, **kwargs})
+        self.logger.info(message, **kwargs)
 
     def debug(self, message: str, **kwargs):
         """Log debug message with context"""
-        self.logger.debug(message, **{**self._context, **kwargs})
+        self.logger.debug(message, **kwargs)
 
     def warning(self, message: str, **kwargs):
         """Log warning message with context"""
-        self.logger.warning(message, **{**self._context, **kwargs})
+        self.logger.warning(message, **kwargs)
 
     def error(self, message: str, **kwargs):
         """Log error message with context"""
-        self.logger.error(message, **{**self._context, **kwargs})
+        self.logger.error(message, **kwargs)
 
     def critical(self, message: str, **kwargs):
         """Log critical message with context"""
-        self.logger.critical(message, **{**self._context, **kwargs})
+        self.logger.critical(message, **kwargs)
 
 
 def get_logger(name: str) -> ContextLogger:
@@ -4,11 +4,17 @@ Secure secrets management utilities
 
 import json
 import os
+import re
 from pathlib import Path
 from typing import Dict, Optional
 
 from cryptography.fernet import Fernet
 
+# Environment variable names containing any of these are stored as secrets
+_SENSITIVE_ENV_RE = re.compile(
+    "BOT_TOKEN|DATABASE_URL|API_KEY|SECRET_KEY|PASSWORD|TOKEN", re.IGNORECASE
+)
+
 
 class SecretsManager:
     """Secure secrets manager with encryption"""
@@ -18,6 +24,10 @@ class SecretsManager:
         self.secrets_file = Path(".secrets.enc")
         self._key: Optional[bytes] = None
         self._fernet: Optional[Fernet] = None
+        # Decrypted contents of secrets_file and the (mtime, size) they were
+        # read at; reused until the file changes on disk
+        self._cache: Optional[Dict[str, str]] = None
+        self._cache_stamp: Optional[tuple[int, int]] = None
 
     def _get_or_create_key(self) -> bytes:
         """Get or create encryption key"""
@@ -50,6 +60,12 @@ class SecretsManager:
         secrets[key] = value
         self._save_secrets(secrets)
 
+    def set_secrets(self, values: Dict[str, str]) -> None:
+        """Store several secrets with a single encrypted write"""
+        secrets = self._load_secrets()
+        secrets.update(values)
+        self._save_secrets(secrets)
+
     def get_secret(self, key: str) -> Optional[str]:
         """Retrieve a secret"""
         secrets = self._load_secrets()
@@ -69,15 +85,23 @@ class SecretsManager:
         if not self.secrets_file.exists():
             return {}
 
+        stamp = self._file_stamp()
+        if self._cache is not None and stamp == self._cache_stamp:
+            # Callers modify the returned dict, so never hand out the cache
+            return dict(self._cache)
+
         try:
             cipher = self._get_cipher()
             encrypted_data = self.secrets_file.read_bytes()
             decrypted_data = cipher.decrypt(encrypted_data)
-            return json.loads(decrypted_data.decode())
+            secrets = json.loads(decrypted_data)
         except Exception:
             # If decryption fails, start fresh
             return {}
 
+        self._cache, self._cache_stamp = dict(secrets), stamp
+        return secrets
+
     def _save_secrets(self, secrets: Dict[str, str]) -> None:
         """Save secrets to encrypted file"""
         cipher = self._get_cipher()
@@ -86,6 +110,12 @@ class SecretsManager:
         self.secrets_file.write_bytes(encrypted_data)
         # Set restrictive permissions
         self.secrets_file.chmod(0o600)
+        self._cache, self._cache_stamp = dict(secrets), self._file_stamp()
+
+    def _file_stamp(self) -> tuple[int, int]:
+        """Identify the current version of the secrets file"""
+        stat = self.secrets_file.stat()
+        return stat.st_mtime_ns, stat.st_size
 
     def list_secrets(self) -> list[str]:
         """List all secret keys"""
@@ -122,20 +152,10 @@ def get_secure_secret(key: str) -> Optional[str]:
 
 def init_secrets_from_env() -> None:
     """Initialize secrets from environment variables"""
-    sensitive_keys = [
-        "BOT_TOKEN",
-        "DATABASE_URL",
-        "API_KEY",
-        "SECRET_KEY",
-        "PASSWORD",
-        "TOKEN",
-    ]
-
-    secrets_manager = get_secrets_manager()
-
-    for key in os.environ:
-        # Check if this is a sensitive key
-        if any(sensitive in key.upper() for sensitive in sensitive_keys):
-            value = os.getenv(key)
-            if value:
-                secrets_manager.set_secret(key, value)
+    sensitive = {
+        key: value
+        for key, value in os.environ.items()
+        if value and _SENSITIVE_ENV_RE.search(key)
+    }
+    if sensitive:
+        get_secrets_manager().set_secrets(sensitive)
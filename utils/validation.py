@@ -3,12 +3,18 @@ Input validation utilities
 """
 
 import re
+from dataclasses import dataclass
 from typing import Optional
 
-from pydantic import BaseModel, StrictInt, field_validator
+# \Z rather than $, which would also accept a trailing newline
+_USERNAME_RE = re.compile(r"^[A-Za-z0-9_]{3,32}\Z")
 
 
-class TelegramUserValidation(BaseModel):
+# These run once per incoming update, so they are plain slotted dataclasses
+# checked in __post_init__ rather than pydantic models; a failed check raises
+# ValueError with the same message the pydantic validators used
+@dataclass(slots=True, kw_only=True)
+class TelegramUserValidation:
     """Schema for validating Telegram user data"""
 
     user_id: int
@@ -16,80 +22,56 @@ class TelegramUserValidation(BaseModel):
     first_name: Optional[str] = None
     is_bot: bool = False
 
-    @field_validator("user_id")
-    @classmethod
-    def validate_user_id(cls, v):
-        """Validate user ID is positive integer"""
-        if not isinstance(v, int) or v <= 0:
+    def __post_init__(self):
+        # Validate user ID is positive integer
+        if not isinstance(self.user_id, int) or self.user_id <= 0:
             raise ValueError("Invalid user ID")
-        return v
-
-    @field_validator("username")
-    @classmethod
-    def validate_username(cls, v):
-        """Validate username format"""
-        if v is not None:
-            if not re.match(r"^[a-zA-Z0-9_]{3,32}$", v):
-                raise ValueError("Invalid username format")
-        return v
-
-    @field_validator("is_bot")
-    @classmethod
-    def validate_is_bot(cls, v):
-        """Ensure user is not a bot"""
-        if v:
+        # Validate username format
+        if self.username is not None and not _USERNAME_RE.match(self.username):
+            raise ValueError("Invalid username format")
+        # Ensure user is not a bot
+        if self.is_bot:
             raise ValueError("Bots are not allowed")
-        return v
 
 
-class DeadlineInputValidation(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class DeadlineInputValidation:
     """Schema for validating deadline input"""
 
     title: str
     description: Optional[str] = None
     due_date: str
 
-    @field_validator("title")
-    @classmethod
-    def validate_title(cls, v):
-        """Validate deadline title"""
-        if not v or not v.strip():
+    def __post_init__(self):
+        if not self.title or not self.title.strip():
             raise ValueError("Title cannot be empty")
-        if len(v) > 200:
+        if len(self.title) > 200:
             raise ValueError("Title too long (max 200 characters)")
-        return v.strip()
-
-    @field_validator("description")
-    @classmethod
-    def validate_description(cls, v):
-        """Validate deadline description"""
-        if v is not None:
-            if len(v) > 1000:
-                raise ValueError("Description too long (max 1000 characters)")
-        return v
-
-    @field_validator("due_date")
-    @classmethod
-    def validate_due_date(cls, v):
-        """Basic validation for due date string"""
-        if not v or not v.strip():
+        self.title = self.title.strip()
+
+        if self.description is not None and len(self.description) > 1000:
+            raise ValueError("Description too long (max 1000 characters)")
+
+        if not self.due_date or not self.due_date.strip():
             raise ValueError("Due date cannot be empty")
-        return v.strip()
+        self.due_date = self.due_date.strip()
 
 
-class NotificationSettingsValidation(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class NotificationSettingsValidation:
     """Schema for validating notification settings"""
 
     enabled: bool = True
-    advance_hours: StrictInt = 24
-
-    @field_validator("advance_hours")
-    @classmethod
-    def validate_advance_hours(cls, v):
-        """Validate advance notification hours"""
-        if not isinstance(v, int) or v < 0 or v > 168:  # Max 1 week
+    advance_hours: int = 24
+
+    def __post_init__(self):
+        # Strict int: no bools and no numeric strings
+        if (
+            isinstance(self.advance_hours, bool)
+            or not isinstance(self.advance_hours, int)
+            or not 0 <= self.advance_hours <= 168  # Max 1 week
+        ):
             raise ValueError("Advance hours must be between 0 and 168")
-        return v
 
 
 def validate_telegram_user(user_data: dict) -> TelegramUserValidation:
@@ -117,8 +99,10 @@ def sanitize_text(text: str, max_length: int = 1000) -> str:
     """Sanitize text input to prevent injection attacks"""
     if not text:
         return ""
+    # Strip first so surrounding whitespace doesn't count toward the limit
+    text = text.strip()
     # Limit length
     if len(text) > max_length:
         text = text[: max_length - 3] + "..."
 
-    return text.strip()
+    return text